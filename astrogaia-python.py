@@ -1,69 +1,141 @@
 #!/usr/bin/python3
 
+from __future__ import annotations
 import argparse
 import sys
 import logging
-import astropy.units as u
-from astropy.coordinates import SkyCoord
-from astroquery.gaia import Gaia
-from astropy.coordinates.name_resolve import NameResolveError
-from astropy.units.core import UnitsError
-from astropy.coordinates import Angle
-from astropy.table import Table
-from pwn import log
-import shutil
-from tabulate import tabulate
 import random
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.offsetbox import AnchoredText
-import matplotlib
+import bisect
 import re
-from typing import List
+from typing import List, TYPE_CHECKING
 import time
 import os
 from dataclasses import dataclass, field
-import requests
 from pathlib import Path
 import signal
 import copy
 import numpy as np
-from tqdm import tqdm
 import warnings
-
-
-# ANSI escape codes dictionary
-colors = {
-        "BLACK": '\033[30m',
-        "RED": '\033[31m',
-        "GREEN": '\033[32m',
-        "BROWN": '\033[33m',
-        "BLUE": '\033[34m',
-        "PURPLE": '\033[35m',
-        "CYAN": '\033[36m',
-        "WHITE": '\033[37m',
-        "GRAY": '\033[1;30m',
-        "L_RED": '\033[1;31m',
-        "L_GREEN": '\033[1;32m',
-        "YELLOW": '\033[1;33m',
-        "L_BLUE": '\033[1;34m',
-        "PINK": '\033[1;35m',
-        "L_CYAN": '\033[1;36m',
-        "NC": '\033[0m'
-        }
+import functools
+import contextlib
+import tempfile
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+# astropy is slow to import, so it is imported only where it is needed. Here it is only used for type hints
+if TYPE_CHECKING:
+    from astropy.table import Table
+
+
+# Use colors only if the output is a terminal and the user has not disabled them (https://no-color.org)
+use_colors: bool = sys.stdout.isatty() and not os.environ.get('NO_COLOR')
+
+
+def ansi_color(code: str) -> str:
+    """
+    ANSI escape code for a color, or an empty string if colors are not used
+    """
+    return f'\033[{code}m' if use_colors else ''
+
+
+# ANSI escape codes
+BLACK: str = ansi_color('30')
+RED: str = ansi_color('31')
+GREEN: str = ansi_color('32')
+BROWN: str = ansi_color('33')
+BLUE: str = ansi_color('34')
+PURPLE: str = ansi_color('35')
+CYAN: str = ansi_color('36')
+WHITE: str = ansi_color('37')
+GRAY: str = ansi_color('1;30')
+L_RED: str = ansi_color('1;31')
+L_GREEN: str = ansi_color('1;32')
+YELLOW: str = ansi_color('1;33')
+L_BLUE: str = ansi_color('1;34')
+PINK: str = ansi_color('1;35')
+L_CYAN: str = ansi_color('1;36')
+NC: str = ansi_color('0')
 script_version = 'v1.0.0'
 
 
 # Define simple characters
-sb: str = f'{colors["L_CYAN"]}[{colors["YELLOW"]}*{colors["L_CYAN"]}]{colors["NC"]}' # [*]
-sb_v2: str = f'{colors["RED"]}[{colors["YELLOW"]}+{colors["RED"]}]{colors["NC"]}' # [*]
+sb: str = f'{L_CYAN}[{YELLOW}*{L_CYAN}]{NC}' # [*]
+sb_v2: str = f'{RED}[{YELLOW}+{RED}]{NC}' # [*]
 whitespaces: str = " "*(len(sb)+1) # '    '
-warning: str = f'{colors["YELLOW"]}[{colors["RED"]}!{colors["YELLOW"]}]{colors["NC"]}' # [!]
+warning: str = f'{YELLOW}[{RED}!{YELLOW}]{NC}' # [!]
+
+
+# File containing the absolute path for the working directory ($HOME/.astrogaia-python/working.txt)
+working_dir_file_path: str = os.path.join(os.path.expanduser("~"), ".astrogaia-python", "working.txt")
+# Directory where online catalogs are cached ($HOME/.cache/astrogaia-python)
+catalogs_cache_dir: str = os.path.join(os.path.expanduser("~"), ".cache", "astrogaia-python")
+# Seconds to wait for a catalog server to connect and to send data, before using the cached catalog (if any)
+catalog_request_timeout: tuple[float, float] = (5., 30.)
+# File caching coordinates (in degrees) of objects already resolved by their names
+resolved_names_cache_file: str = os.path.join(catalogs_cache_dir, "names.json")
+# File caching the columns of a Gaia table ('show-gaia-content'), filled later with the table name
+gaia_content_cache_file: str = os.path.join(catalogs_cache_dir, "{service}_content.json")
+
+
+# Messages displayed while saving data. They are colored once here and filled later with 'str.format'
+saving_data_title: str = f"{L_GREEN}Saving data{NC}"
+no_outfile_provided_msg: str = (f"{YELLOW}No outfile name provided in input. {GREEN}Data will be saved as\n"
+                                f"'{L_BLUE}{{filename}}{GREEN}'\ninto working directory ('{{short_path}}'){NC}")
+saving_absolute_path_msg: str = f"{GREEN}Saving {{command!r}} data in '{{filename}}'"
+saving_current_dir_msg: str = f"{GREEN}Saving data in '{{filename}}' file into current directory ('{{current_path}}')..."
+outfile_exists_msg: str = f"{warning} {GREEN}Output file already exists ('{{short_path}}'){NC}"
+ask_replace_file_msg: str = f"{sb_v2} {GREEN}Do you want to replace the file? {RED}[Y]es/[N]o{NC}: "
+not_replacing_file_msg: str = f"{RED}Not replacing file. Exiting...{NC}"
+saving_file_as_msg: str = f"{sb} {GREEN}Saving file as '{{short_path}}' with '{{data_format}}' data format...{NC}"
+data_replaced_msg: str = f"{L_GREEN}Data saved{NC}"
+data_saved_msg: str = f"{GREEN}Data saved{NC}"
+data_obtained_from_archives_msg: str = f"{sb} {GREEN}Data succesfully obtained from Archives{NC}"
+
+
+# Descriptions and help messages for commands, which are always displayed by the main parser
+general_description: str = (f"{L_CYAN}Gaia DR3 tool written in Python 💫{NC} -- "
+                            f"{L_GREEN}Contact: {GREEN}Francisco Carrasco Varela \
+                             (ffcarrasco@uc.cl) ⭐{NC}")
+extract_command_help: str = f"{RED}Different modes to extract data{NC}"
+extract_command_description: str = f"{L_RED}Extract data from Gaia{NC}"
+plot_command_help: str = f"{GREEN}Plot data{NC}"
+show_content_command_help: str = f"{BROWN}Show the type of content that different Gaia Releases can provide{NC}"
+
+
+class progressLog:
+    """
+    Display the progress of a task in a single line, updated in place: '[x] Title: status'. Once the task is done it
+    is marked with '[+]' (success) or '[-]' (failure)
+    """
+    __slots__ = ('title', 'interactive')
+
+    def __init__(self, title: str):
+        self.title = title
+        # Only rewrite the same line if the output is a terminal, otherwise only print the final result
+        self.interactive = sys.stdout.isatty()
+        if self.interactive:
+            self._write(f"[{BLUE}x{NC}] {title}")
+
+    def _write(self, text: str, end: str = '') -> None:
+        # '\r' goes back to the beginning of the line and '\033[K' clears it
+        sys.stdout.write(f"\r\033[K{text}{end}" if self.interactive else f"{text}{end}")
+        sys.stdout.flush()
+
+    def status(self, status: str) -> None:
+        if self.interactive:
+            self._write(f"[{BLUE}x{NC}] {self.title}: {status}")
+
+    def success(self, status: str = 'Done') -> None:
+        self._write(f"[{GREEN}+{NC}] {self.title}: {status}", end='\n')
+
+    def failure(self, status: str = 'Failed') -> None:
+        self._write(f"[{RED}-{NC}] {self.title}: {status}", end='\n')
 
 
 # Ctrl-C
 def signal_handler(signal, frame):
-    print(f"{warning} {colors['L_RED']}Ctrl-C. Exiting...{colors['NC']}")
+    print(f"{warning} {L_RED}Ctrl-C. Exiting...{NC}")
     sys.exit(1)
 
 
@@ -77,45 +149,30 @@ signal.signal(signal.SIGINT, signal_handler)
 warnings.filterwarnings('ignore')
 
 
-# Get user flags
-def parseArgs():
+def add_extract_command_arguments(extract_command) -> None:
     """
-    Get commands and flags provided by the user
+    Add subcommands and flags for 'extract' command
     """
-    # General description / contact info
-    general_description = f"{colors['L_CYAN']}Gaia DR3 tool written in Python 💫{colors['NC']} -- "
-    general_description += f"{colors['L_GREEN']}Contact: {colors['GREEN']}Francisco Carrasco Varela \
-                             (ffcarrasco@uc.cl) ⭐{colors['NC']}"
-
-    parser = argparse.ArgumentParser(description=f"{general_description}", epilog=f"example: {sys.argv[0]} extract")
-
-    # Define commands
-    commands = parser.add_subparsers(dest='command')
-
-    ### 'extract' command
-    str_extract_command: str = 'extract'
-    extract_command = commands.add_parser(str_extract_command, help=f'{colors["RED"]}Different modes to extract data{colors["NC"]}', 
-                    description=f'{colors["L_RED"]}Extract data from Gaia{colors["NC"]}', epilog=f"example: {sys.argv[0]} extract raw")
     parser_sub_extract = extract_command.add_subparsers(dest='subcommand', 
-                                                        help=f"{colors['RED']}Select the source/method to extract data{colors['NC']}")
+                                                        help=f"{RED}Select the source/method to extract data{NC}")
 
     # Sub-command extract - raw
     str_extract_subcommand_raw: str = 'raw'
-    extract_raw_subcommand_help = f"{colors['L_RED']}Extract raw Gaia data directly from Archive{colors['NC']}"
+    extract_raw_subcommand_help = f"{L_RED}Extract raw Gaia data directly from Archive{NC}"
     extract_subcommand_raw = parser_sub_extract.add_parser(str_extract_subcommand_raw, description=extract_raw_subcommand_help,
-                                                           help=f"{colors['RED']}Extract raw Gaia data directly from Archive{colors['NC']}",
+                                                           help=f"{RED}Extract raw Gaia data directly from Archive{NC}",
                                                            epilog=f"example: {sys.argv[0]} extract raw rectangle")
     # Sub-subcommand: extract - raw - cone
-    extract_raw_cone_subsubcommand_help = f"{colors['RED']}Extract data in 'cone search' mode{colors['NC']}"
-    parser_sub_extract_raw = extract_subcommand_raw.add_subparsers(dest='subsubcommand', help=f"{colors['RED']}Shape to extract data{colors['NC']}")
+    extract_raw_cone_subsubcommand_help = f"{RED}Extract data in 'cone search' mode{NC}"
+    parser_sub_extract_raw = extract_subcommand_raw.add_subparsers(dest='subsubcommand', help=f"{RED}Shape to extract data{NC}")
 
     str_extract_subcommand_raw_subsubcommand_cone = 'cone'
-    epilog_str_extract_raw_cone_example = rf'''examples: {sys.argv[0]} extract raw cone -n "47 Tuc" -r 2.1 {colors["GRAY"]}# Extract data for "47 Tucanae" or "NGC104"{colors["NC"]}
-          {sys.argv[0]} extract raw cone --right-ascension "210" --declination "-60" -r 1.2 -n "myObject" {colors["GRAY"]}# Use a custom name/object, but you have to provide coords{colors["NC"]}
-          {sys.argv[0]} extract raw cone --right-ascension="20h50m45.7s" --declination="-5d23m33.3s" -r=3.3 {colors["GRAY"]}# Search for negative coordinates{colors["NC"]}
+    epilog_str_extract_raw_cone_example = rf'''examples: {sys.argv[0]} extract raw cone -n "47 Tuc" -r 2.1 {GRAY}# Extract data for "47 Tucanae" or "NGC104"{NC}
+          {sys.argv[0]} extract raw cone --right-ascension "210" --declination "-60" -r 1.2 -n "myObject" {GRAY}# Use a custom name/object, but you have to provide coords{NC}
+          {sys.argv[0]} extract raw cone --right-ascension="20h50m45.7s" --declination="-5d23m33.3s" -r=3.3 {GRAY}# Search for negative coordinates{NC}
           '''
     extract_subcommand_raw_subsubcommand_cone = parser_sub_extract_raw.add_parser(str_extract_subcommand_raw_subsubcommand_cone,
-                                                                          help=f"{colors['RED']}Extract data in 'cone search' mode{colors['NC']}",
+                                                                          help=f"{RED}Extract data in 'cone search' mode{NC}",
                                                                           description=extract_raw_cone_subsubcommand_help,
                                                                           epilog=epilog_str_extract_raw_cone_example, formatter_class=argparse.RawTextHelpFormatter)
     extract_subcommand_raw_subsubcommand_cone.add_argument('-n', '--name', type=str, required=True,
@@ -146,8 +203,8 @@ def parseArgs():
     str_extract_subcommand_raw_subsubcommand_rect = 'rectangle'
     extract_subcommand_raw_subsubcommand_rect_example = f"example: {sys.argv[0]} extract raw rectangle -ra '210' -dec '-60' -w 6.5 -ht 5"
     extract_subcommand_raw_subsubcommand_rect = parser_sub_extract_raw.add_parser(str_extract_subcommand_raw_subsubcommand_rect,
-                                                                                  help=f"{colors['RED']}Extract data in 'rectangle search' mode{colors['NC']}",
-                                                                                  description=f"{colors['L_RED']}Extract data in rectangle shape/mode{colors['NC']}",
+                                                                                  help=f"{RED}Extract data in 'rectangle search' mode{NC}",
+                                                                                  description=f"{L_RED}Extract data in rectangle shape/mode{NC}",
                                                                                   epilog=extract_subcommand_raw_subsubcommand_rect_example)
     extract_subcommand_raw_subsubcommand_rect.add_argument('-n', '--name', type=str, required=True,
                                                            help="Object name. Ideally how it is found in catalogs and no spaces. Examples: 'NGC104', 'NGC_6121', 'Omega_Cen', 'myObject'")
@@ -181,8 +238,8 @@ def parseArgs():
     str_extract_subcommand_raw_subsubcommand_ring = 'ring'
     extract_subcommand_raw_subsubcommand_ring_example = f"example: {sys.argv[0]} extract raw ring -ra '210' -dec '-60.5' -i 7.0 -e 6.5"
     extract_subcommand_raw_subsubcommand_ring = parser_sub_extract_raw.add_parser(str_extract_subcommand_raw_subsubcommand_ring,
-                                                                                  help=f"{colors['RED']}Extract data in 'Annulus/Ring Search' mode{colors['NC']}",
-                                                                                  description=f"{colors['L_RED']}Extract data in annulus/ring shape/mode using 2 Cones with different radius{colors['NC']}",
+                                                                                  help=f"{RED}Extract data in 'Annulus/Ring Search' mode{NC}",
+                                                                                  description=f"{L_RED}Extract data in annulus/ring shape/mode using 2 Cones with different radius{NC}",
                                                                                   epilog=f"example: {extract_subcommand_raw_subsubcommand_ring_example}")
     extract_subcommand_raw_subsubcommand_ring.add_argument('-n', '--name', type=str, required=True,
                                                            help="Object name. Ideally how it is found in catalogs and no spaces. Examples: 'NGC104', 'NGC_6121', 'Omega_Cen', 'myObject'")
@@ -213,25 +270,25 @@ def parseArgs():
 
     # Sub-command extract - filter
     str_extract_subcommand_filter: str = 'filter'
-    extract_filter_subcommand_help = f"{colors['L_BLUE']}Filter Gaia data applying different methods{colors['NC']}"
+    extract_filter_subcommand_help = f"{L_BLUE}Filter Gaia data applying different methods{NC}"
     extract_subcommand_filter = parser_sub_extract.add_parser(str_extract_subcommand_filter, description=extract_filter_subcommand_help,
-                                                           help=f"{colors['BLUE']}Filter Gaia data applying different methods{colors['NC']}",
+                                                           help=f"{BLUE}Filter Gaia data applying different methods{NC}",
                                                            epilog=f"example: {sys.argv[0]} extract filter parameters")
 
     
-    extract_filter_subsubcommand_help = f"{colors['BLUE']}Filter data from Gaia{colors['NC']}"
+    extract_filter_subsubcommand_help = f"{BLUE}Filter data from Gaia{NC}"
     parser_sub_filter = extract_subcommand_filter.add_subparsers(dest='subsubcommand', help=f"{extract_filter_subsubcommand_help}")
 
     # Sub-subcommand: extract - filter - parameters
     str_extract_subcommand_filter_subsubcommand_parameters = 'parameters'
-    extract_filter_parameters_subsubcommand_help = f"{colors['PURPLE']}Filter Gaia data based on its parameters such as errors, magnitudes, etc{colors['NC']}"
-    epilog_str_extract_filter_parameters_example = rf'''examples: {sys.argv[0]} extract filter cone -n "47 Tuc" -r 2.1 {colors["GRAY"]}# Extract data for "47 Tucanae" or "NGC104"{colors["NC"]}
-          {sys.argv[0]} extract raw cone --right-ascension "210" --declination "-60" -r 1.2 -n "myObject" {colors["GRAY"]}# Use a custom name/object, but you have to provide coords{colors["NC"]}
-          {sys.argv[0]} extract raw cone --right-ascension="20h50m45.7s" --declination="-5d23m33.3s" -r=3.3 {colors["GRAY"]}# Search for negative coordinates{colors["NC"]}
+    extract_filter_parameters_subsubcommand_help = f"{PURPLE}Filter Gaia data based on its parameters such as errors, magnitudes, etc{NC}"
+    epilog_str_extract_filter_parameters_example = rf'''examples: {sys.argv[0]} extract filter cone -n "47 Tuc" -r 2.1 {GRAY}# Extract data for "47 Tucanae" or "NGC104"{NC}
+          {sys.argv[0]} extract raw cone --right-ascension "210" --declination "-60" -r 1.2 -n "myObject" {GRAY}# Use a custom name/object, but you have to provide coords{NC}
+          {sys.argv[0]} extract raw cone --right-ascension="20h50m45.7s" --declination="-5d23m33.3s" -r=3.3 {GRAY}# Search for negative coordinates{NC}
           '''
     extract_subcommand_filter_subsubcommand_parameters = parser_sub_filter.add_parser(str_extract_subcommand_filter_subsubcommand_parameters,
                                                                                       help=extract_filter_parameters_subsubcommand_help,
-                                                                                      description=f"{colors['RED']}Filter Gaia data based on parameters returned in data{colors['NC']}",
+                                                                                      description=f"{RED}Filter Gaia data based on parameters returned in data{NC}",
                                                                                       epilog=epilog_str_extract_filter_parameters_example, 
                                                                                       formatter_class=argparse.RawTextHelpFormatter)
     extract_subcommand_filter_subsubcommand_parameters.add_argument('-f', '--file', type=str,
@@ -282,8 +339,8 @@ def parseArgs():
     str_extract_subcommand_filter_subsubcommand_ellipse = 'ellipse'
     extract_subcommand_filter_subsubcommand_ellipse_example = f"example: {sys.argv[0]} extract filter ellipse -f ngc104_raw.dat --width 5.5 10.2 --height 6.6 7.2"
     extract_subcommand_filter_subsubcommand_ellipse = parser_sub_filter.add_parser(str_extract_subcommand_filter_subsubcommand_ellipse,
-                                                                                  help=f"{colors['RED']}Extract data within an ellipse in Vector Point Diagram{colors['NC']}",
-                                                                                  description=f"{colors['L_RED']}Extract data in annulus/ring shape/mode using 2 Cones with different radius{colors['NC']}",
+                                                                                  help=f"{RED}Extract data within an ellipse in Vector Point Diagram{NC}",
+                                                                                  description=f"{L_RED}Extract data in annulus/ring shape/mode using 2 Cones with different radius{NC}",
                                                                                   epilog=extract_subcommand_filter_subsubcommand_ellipse_example,
                                                                                   formatter_class=argparse.RawTextHelpFormatter)
     extract_subcommand_filter_subsubcommand_ellipse.add_argument('-f', '--file', type=str, required=True,
@@ -319,8 +376,8 @@ def parseArgs():
     str_extract_subcommand_filter_subsubcommand_cordoni = 'cordoni'
     extract_subcommand_filter_subsubcommand_cordoni_example = f"example: {sys.argv[0]} extract filter cordoni -f ngc104_filter_ellipse.dat"
     extract_subcommand_filter_subsubcommand_cordoni = parser_sub_filter.add_parser(str_extract_subcommand_filter_subsubcommand_cordoni,
-                                                                                  help=f"{colors['CYAN']}Apply Cordoni et al. (2018, ApJ, 869, 139C) filtering algorithm to data{colors['NC']}",
-                                                                                  description=f"{colors['CYAN']}Apply Cordoni et al. (2018, ApJ, 869, 139C) filtering algorithm to Gaia data{colors['NC']}",
+                                                                                  help=f"{CYAN}Apply Cordoni et al. (2018, ApJ, 869, 139C) filtering algorithm to data{NC}",
+                                                                                  description=f"{CYAN}Apply Cordoni et al. (2018, ApJ, 869, 139C) filtering algorithm to Gaia data{NC}",
                                                                                   epilog=extract_subcommand_filter_subsubcommand_cordoni_example,
                                                                                   formatter_class=argparse.RawTextHelpFormatter)
     extract_subcommand_filter_subsubcommand_cordoni.add_argument('-f', '--file', type=str, required=True,
@@ -368,17 +425,18 @@ def parseArgs():
     extract_subcommand_filter_subsubcommand_cordoni.add_argument('--force-create-directory', action="store_false", help='Forces (do not ask) creating a folder where all data output will be stored')
     extract_subcommand_filter_subsubcommand_cordoni.add_argument('--force-overwrite-outfile', action="store_true", help='Forces overwriting/replace old file without asking to the user')
 
-    ### 'plot' command
-    str_plot_command: str = 'plot'
-    plot_command = commands.add_parser(str_plot_command, help=f"{colors['GREEN']}Plot data{colors['NC']}")
 
+def add_plot_command_arguments(plot_command) -> None:
+    """
+    Add subcommands and flags for 'plot' command
+    """
     # Sub-command plot -> raw -- Plot data without any filter
     parser_subcommand_plot = plot_command.add_subparsers(dest='subcommand', help="Different modes to plot Gaia data")
 
     str_plot_subcommand_raw: str = 'raw'
     plot_subcommand_raw = parser_subcommand_plot.add_parser(str_plot_subcommand_raw,
                                                             help='Plot data directly extracted from Gaia Archive',
-                                                            description=f'{colors["L_RED"]}Plot data directly extracted from Gaia Archive{colors["NC"]}')
+                                                            description=f'{L_RED}Plot data directly extracted from Gaia Archive{NC}')
     plot_subcommand_raw.add_argument('-n', '--name', help="Set a object name for the sample. Example: 'NGC104', 'my_sample'")
     plot_subcommand_raw.add_argument("--right-ascension", help="Right Ascension (J2000) for the center of data")
     plot_subcommand_raw.add_argument("--declination", help="Declination (J2000) for the center of data")
@@ -391,81 +449,100 @@ def parseArgs():
     plot_subcommand_filter = parser_subcommand_plot.add_parser(str_plot_subcommand_filter, 
                                                                help=f"Plot data from a file containing Gaia data")
     plot_subcommand_filter.add_argument("-n", "--name", help="Set a object name for the sample. Example: 'NGC104', 'my_sample'")
-    ### 'show-gaia-content' command
-    str_show_content_command: str = 'show-gaia-content'
-    show_content_command =  commands.add_parser(str_show_content_command, 
-                                                help=f"{colors['BROWN']}Show the type of content that different Gaia Releases can provide{colors['NC']}")
+
+
+def add_show_content_command_arguments(show_content_command) -> None:
+    """
+    Add flags for 'show-gaia-content' command
+    """
     show_content_command.add_argument('-r', '--gaia-release', default='gdr3',
                                       help="Select the Gaia Data Release you want to display what type of data contains. \
                                             Valid options: {gdr3, gaiadr3, g3dr3, gaia3dr3, gdr2, gaiadr2}")
     show_content_command.add_argument('-t', '--table-format', default='grid', 
                                       help="Table display format (default='grid'). To check all formats available visit: https://pypi.org/project/tabulate/")
+
+
+# Functions that add the subcommands/flags for every command
+command_arguments_builders = {"extract": add_extract_command_arguments,
+                              "plot": add_plot_command_arguments,
+                              "show-gaia-content": add_show_content_command_arguments}
+
+
+# Get user flags
+def parseArgs():
+    """
+    Get commands and flags provided by the user
+    """
+    parser = argparse.ArgumentParser(description=general_description, epilog=f"example: {sys.argv[0]} extract")
+
+    # Define commands
+    commands = parser.add_subparsers(dest='command')
+
+    ### 'extract' command
+    str_extract_command: str = 'extract'
+    extract_command = commands.add_parser(str_extract_command, help=extract_command_help, 
+                    description=extract_command_description, epilog=f"example: {sys.argv[0]} extract raw")
+
+    ### 'plot' command
+    str_plot_command: str = 'plot'
+    plot_command = commands.add_parser(str_plot_command, help=plot_command_help)
+
+    ### 'show-gaia-content' command
+    str_show_content_command: str = 'show-gaia-content'
+    show_content_command =  commands.add_parser(str_show_content_command, help=show_content_command_help)
+
+    # Only build subcommands and flags for the command requested by the user, the other ones are never used
+    requested_command = sys.argv[1] if len(sys.argv) > 1 else None
+    command_parsers = {str_extract_command: extract_command, str_plot_command: plot_command,
+                       str_show_content_command: show_content_command}
+    if requested_command in command_parsers:
+        command_arguments_builders[requested_command](command_parsers[requested_command])
     # parse the command-line arguments
     args = parser.parse_args()
     return parser, args
 
 
+# Commands (with their subcommands) that only display their help if they are provided without any other argument
+commands_showing_help = frozenset(((),
+                                   ('extract',), ('extract', 'raw'), ('extract', 'filter'), ('extract', 'raw', 'rectangle'),
+                                   ('plot',), ('plot', 'raw'), ('plot', 'from-file')))
+
+
 def checkUserHasProvidedArguments(parser_provided, args_provided, n_args_provided) -> None:
     """
     Display help messages if the user has not provided arguments to a command/subcommand
     """
-    # If user has not provided a command
-    if args_provided.command is None:
-        parser_provided.parse_args(['-h'])
+    # Command, subcommand and subsubcommand provided by the user (if any)
+    provided_commands = tuple(command for command in (args_provided.command,
+                                                      getattr(args_provided, 'subcommand', None),
+                                                      getattr(args_provided, 'subsubcommand', None))
+                              if command is not None)
+    # If nothing else than these commands has been provided, show their help
+    if n_args_provided == len(provided_commands) + 1 and provided_commands in commands_showing_help:
+        parser_provided.parse_args([*provided_commands, '-h'])
 
-    # If user has not provided a subcommand  
-    if args_provided.command == "extract" and args_provided.subcommand is None:
-        parser_provided.parse_args(['extract', '-h'])
 
-    
-    # If user has not provided any argument for the subcommand
-    if args_provided.command == "extract" and args_provided.subcommand == "raw" and n_args_provided == 3:
-        parser_provided.parse_args(['extract', 'raw', '-h'])
+# Valid object names: letters, numbers, underscores and spaces (not at the beginning)
+object_name_pattern = re.compile(r'^\w[\w ]*\Z')
 
-    if args_provided.command == "extract" and args_provided.subcommand == "filter" and n_args_provided == 3:
-        parser_provided.parse_args(['extract', 'filter', '-h'])
 
-    if args_provided.command == "extract" and args_provided.subcommand == "raw" and args_provided.subsubcommand=="rectangle" and n_args_provided == 4:
-        parser_provided.parse_args(['extract', 'raw', 'rectangle', '-h'])
-
-    if args_provided.command == "plot" and args_provided.subcommand is None:
-        parser_provided.parse_args(['plot', '-h'])
-
-    if args_provided.command == "plot" and args_provided.subcommand == "raw" and n_args_provided == 3:
-        parser_provided.parse_args(['plot', 'raw', '-h'])
-
-    if args_provided.command == "plot" and args_provided.subcommand == "from-file" and n_args_provided == 3:
-        parser_provided.parse_args(['plot', 'from-file', '-h'])
-            
-
-def checkNameObjectProvidedByUser(name_object) -> None:
+def checkNameObjectProvidedByUser(name_object) -> str:
     """
     Checks if a user has provided a valid object name. For example, object name 'NGC104' is valid, '<NGC104>' is not. 
-    Also, 'NGC 104' is converted to 'NGC_104' for future functions/usage
+    Returns the name without leading/trailing spaces. Spaces in the middle (e.g., 'NGC 104') are kept, since they are
+    needed to resolve the name online; they are replaced by '_' only when saving files
     """
-    pattern = r'^[\w ]+$'
-    pass_test = bool(re.match(pattern, name_object))
-    if pass_test:
-        return
-    if not pass_test:
-        print(f"{warning} You have provided an invalid name (which may contain invalid characters): {colors['RED']}'{name_object}'{colors['NC']}")
+    name_object = name_object.strip()
+    if object_name_pattern.match(name_object):
+        return name_object
+    else:
+        print(f"{warning} You have provided an invalid name (which may contain invalid characters): {RED}'{name_object}'{NC}")
         print(f"    Valid object names examples: NGC104  --  alessa1 -- myRandomObject -- i_love_my_dog")
         sys.exit(1)
 
 
-def printBanner() -> None:
-    # Color 1
-    rand_number = random.randint(31,36) 
-    c = f'\033[1;{rand_number}m' # color
-    sh = f'\033[{rand_number}m' # shadow
-    nc = colors['NC'] # no color / reset color
-    # Color 2
-    rand_number2 = random.randint(31,36) 
-    c2 = f'\033[1;{rand_number2}m' # color
-    sh2 = f'\033[{rand_number2}m' # shadow
-    rand_number3 = random.randint(31,36) 
-    c3 = f'\033[1;{rand_number3}m' # color
-    banner = rf'''   {c}_____            __{nc}                  
+# Banner template, colors are filled in every run with 'str.format'
+banner_template: str = r'''   {c}_____            __{nc}                  
  {c} /  {sh}_  {c}\   _______/  |________  ____{nc}  
 {c} /  {sh}/_\  {c}\ /  ___/\   __\_  __ \/  {sh}_ {c}\{nc}  
 {c}/    |    \\___ \  |  |  |  | \(  {sh}<_> {c}){nc} 
@@ -476,8 +553,23 @@ def printBanner() -> None:
 {c2}    /   \  ___\__  \ |  \__  \{nc}             
 {c2}    \    \_\  \/ {sh2}__ {c2}\|  |/ {sh2}__ {c2}\_{nc}            
 {c2}     \______  (____  /__(____  /{nc}           
-{c2}            \/     \/        \/{nc} {colors['GRAY']} {script_version}{nc}
+{c2}            \/     \/        \/{nc} {gray} {version}{nc}
     '''
+
+
+def printBanner() -> None:
+    # Color 1
+    rand_number = random.randint(31,36) 
+    c = ansi_color(f'1;{rand_number}') # color
+    sh = ansi_color(f'{rand_number}') # shadow
+    nc = NC # no color / reset color
+    # Color 2
+    rand_number2 = random.randint(31,36) 
+    c2 = ansi_color(f'1;{rand_number2}') # color
+    sh2 = ansi_color(f'{rand_number2}') # shadow
+    rand_number3 = random.randint(31,36) 
+    c3 = ansi_color(f'1;{rand_number3}') # color
+    banner = banner_template.format(c=c, sh=sh, c2=c2, sh2=sh2, nc=nc, gray=GRAY, version=script_version)
     print(banner)
     print(f"\n{' ' * 11}by {c3}Francisco Carrasco Varela{nc}")
     print(f"{' ' * 6}{c3} P. Universidad Católica de Chile{nc}")
@@ -489,16 +581,30 @@ def randomColor() -> str:
     """
     Select a random color for text
     """
-    return f'\033[{random.randint(31,36)}m'
+    return ansi_color(f'{random.randint(31,36)}')
 
 
-def displaySections(text, color_chosen=colors['NC'], character='#', c=randomColor()):
+@functools.lru_cache(maxsize=1)
+def get_terminal_width() -> int:
+    """
+    Get the user's terminal width. It is obtained only once, unless the terminal is resized
+    """
+    import shutil
+    return shutil.get_terminal_size().columns
+
+
+# Get the new terminal width only if the terminal is resized
+if hasattr(signal, 'SIGWINCH'):
+    signal.signal(signal.SIGWINCH, lambda signum, frame: get_terminal_width.cache_clear())
+
+
+def displaySections(text, color_chosen=NC, character='#', c=randomColor()):
     """
     Displays a section based on the user option/command
     """
-    nc = colors['NC']
+    nc = NC
     # Get the user's terminal width and compute its half size
-    terminal_width = shutil.get_terminal_size().columns
+    terminal_width = get_terminal_width()
     total_width = terminal_width // 2
     text_width = len(text) + 2
     padding_width = (total_width - text_width) // 2
@@ -516,119 +622,138 @@ def displaySections(text, color_chosen=colors['NC'], character='#', c=randomColo
     print(f"\n{c}{border}{nc}\n{centered_text}\n{c}{border}{nc}\n")
 
 
+# Characters for sections and their cumulative probabilities:
+# 80% to pick '#', 20% remaining distributed for other characters
+section_chars = ('#', '=', '+', '$', '@')
+section_chars_cum_weights = (0.8, 0.85, 0.9, 0.95, 1.0)
+
+
 def randomChar() -> str:
     """
     Select a random character to be printed
     """
-    char_list = ['#', '=', '+', '$', '@']
-    # 80% to pick '#', 20% remaining distributed for other characters
-    weight_list = [0.8, 0.05, 0.05, 0.05, 0.05]
-    return random.choices(char_list, weights=weight_list,k=1)[0]
+    random_value = random.random()
+    if random_value < section_chars_cum_weights[0]:
+        return section_chars[0]
+    return section_chars[bisect.bisect_right(section_chars_cum_weights, random_value)]
 
 
 #######################
 ## show-gaia-content ##
 #######################
-def read_columns_in_gaia_table(output_list):
-    """
-    We saved each column separated by '|'. Now use that character to split every row into its respective columns
-    """
-    rows = []
-
-    for line in output_list:
-        col = []
-        row = line.strip().split("|")
-        for column in row:
-            col.append(column.strip())
-        rows.append(col)
-    return rows
+# Colored headers for the table displayed by 'show-gaia-content'
+gaia_content_headers_table: list[str] = [f"{L_CYAN}Row{NC}",
+                                         f"{PINK}Name{NC}",
+                                         f"{YELLOW}Var Type{NC}",
+                                         f"{L_RED}Units{NC}",
+                                         f"{L_GREEN}Description{NC}"]
 
 
 def create_table_elements(width_terminal, printable_data_rows_table):
     """
     Add colors to the table and sets their parts ready to be printed
     """
-    # Headers for the table
-    headers_table = ["Row", "Name" ,"Var Type", "Unit", "Description"]
-    # Get the max length (the sum of them) for columns that are not the "Description column"
-    max_length = 0
+    # Colors for 'Row', 'Name', 'Var Type', 'Unit' and 'Description' columns
+    cyan, purple, brown, red, green = CYAN, PURPLE, BROWN, RED, GREEN
+    nc = NC
+    # In a single pass, get the max length (the sum of them) for columns that are not the "Description" column and
+    # create a table body containing ANSI escape codes so it will print in colors
     extra_gap = 19
-    table_to_show = [row for row in printable_data_rows_table]
-    for col in printable_data_rows_table:
-        new_length = len(col[0]) + len(col[1]) + len(col[2]) + len(col[3]) + extra_gap 
-        if new_length > max_length:
-            max_length = new_length
+    max_length = 0
+    colors_row_table = []
+    for row, name, var_type, unit, description in printable_data_rows_table:
+        max_length = max(max_length, len(row) + len(name) + len(var_type) + len(unit))
+        colors_row_table.append((f"{cyan}{row}{nc}",
+                                 f"{purple}{name}{nc}",
+                                 f"{brown}{var_type}{nc}",
+                                 f"{red}{unit}{nc}",
+                                 f"{green}{description}{nc}"))
+    max_length += extra_gap
     # Max allowed length before 'wrapping' text
     max_allowed_length = width_terminal - max_length - extra_gap
-
-    colors_headers_table = [f"{colors['L_CYAN']}Row{colors['NC']}",
-                            f"{colors['PINK']}Name{colors['NC']}",
-                            f"{colors['YELLOW']}Var Type{colors['NC']}",
-                            f"{colors['L_RED']}Units{colors['NC']}",
-                            f"{colors['L_GREEN']}Description{colors['NC']}"]
-    # Create a table body containing ANSI escape codes so it will print in colors
-    colors_row_table = []
-    for column_value in printable_data_rows_table:
-        color_column = []
-        # 'Row' column
-        color_column.append(f"{colors['CYAN']}{column_value[0]}{colors['NC']}")
-        # 'Name' column
-        color_column.append(f"{colors['PURPLE']}{column_value[1]}{colors['NC']}")
-        # 'Var Type' column
-        color_column.append(f"{colors['BROWN']}{column_value[2]}{colors['NC']}")
-        # 'Unit' column
-        color_column.append(f"{colors['RED']}{column_value[3]}{colors['NC']}")
-        # 'Description' column
-        color_column.append(f"{colors['GREEN']}{column_value[4]}{colors['NC']}")
-        colors_row_table.append(color_column)
-    return colors_headers_table, colors_row_table, max_allowed_length
+    return gaia_content_headers_table, colors_row_table, max_allowed_length
 
 
 def print_table(body_table, headers_table, max_allowed_length, table_format):
     """
     Print the final table/result
     """
+    from tabulate import tabulate
     print()
     print(tabulate(body_table, 
           headers=headers_table, tablefmt=table_format, 
           maxcolwidths=[None, None, None, None, max_allowed_length]))
 
 
+# Gaia Archive tables for every name a Gaia Data Release can be provided with (--gaia-release)
+gaia_services = {'gdr3': 'gaiadr3.gaia_source', 'gaiadr3': 'gaiadr3.gaia_source',
+                 'g3dr3': 'gaiadr3.gaia_source', 'gaia3dr3': 'gaiadr3.gaia_source',
+                 'gedr3': 'gaiaedr3.gaia_source', 'gaiaedr3': 'gaiaedr3.gaia_source',
+                 'gdr2': 'gaiadr2.gaia_source', 'gaiadr2': 'gaiadr2.gaia_source'}
+
+
+@functools.lru_cache(maxsize=None)
 def select_gaia_astroquery_service(service_requested: str) -> str:
     """
-    Check the service the user wants to use
+    Check the service the user wants to use. The result is kept, so a warning for an invalid service is shown only once
     """
-    service_requested = service_requested.lower()
-    if 'gaiadr3' in service_requested or 'gdr3' in service_requested:
-        service = 'gaiadr3.gaia_source'
-    elif 'gaiaedr3' in service_requested or 'gedr3' in service_requested:
-        service = 'gaiaedr3.gaia_source'
-    elif 'gaiadr2' in service_requested or 'gdr2' in service_requested:
-        service = 'gaiadr2.gaia_source'
-    else:
+    service = gaia_services.get(service_requested.lower().strip())
+    if service is None:
         print(f"The service you provided is not valid ('{service_requested}'). Using 'GaiaDR3' (default)...")
         service = 'gaiadr3.gaia_source'
     return service
     
 
+@contextlib.contextmanager
+def quiet_astroquery_logs():
+    """
+    Only show warnings (and worse) from Astroquery while a query is running, restoring the previous level after it
+    """
+    # Obtained here, once Astroquery has been imported, so it is created with Astropy's logger class
+    astroquery_logger = logging.getLogger('astroquery')
+    previous_level = astroquery_logger.level
+    astroquery_logger.setLevel(logging.WARNING)
+    try:
+        yield
+    finally:
+        astroquery_logger.setLevel(previous_level)
+
+
+def get_gaia_table_columns(service: str) -> list:
+    """
+    Get the columns (with their name, data type, unit and description) of a Gaia table from the Archive metadata,
+    without requesting any data
+    """
+    # Imported here since it is slow to import and only needed when requesting data
+    from astroquery.gaia import Gaia
+    p = progressLog(f'{L_GREEN}Requesting table metadata{NC}')
+    try:
+        p.status(f"{PURPLE}Querying columns for '{service.replace('.gaia_source', '')}' service...{NC}")
+        with quiet_astroquery_logs():
+            table = Gaia.load_table(service)
+    except Exception:
+        p.failure(f"{RED}Error while trying to request table metadata{NC}")
+        sys.exit(1)
+    p.success(f"{L_GREEN}Metadata obtained!{NC}")
+    return table.columns
+
+
 def get_data_via_astroquery(args, object_info, mode, purpose='normal'):
     #(args, input_ra, input_dec, mode)
     """
-    Get data applying a query to Astroquery
+    Get data applying a query to Astroquery. For 'cone' mode, 'object_info' RA and DEC can also be arrays (deg)
+    to request several cones at once
     """
+    # Imported here since they are slow to import and only needed when requesting data
+    import astropy.units as u
+    from astropy.coordinates import SkyCoord
+    from astropy.table import Table
+    from astroquery.gaia import Gaia
     # Get the service to request data
     service = select_gaia_astroquery_service(args.gaia_release)
 
     ### Get the input parameters
 
-    # Mode for "show-gaia-content" command
-    if purpose == 'content' and mode == 'cone':
-        input_ra = 280
-        input_dec = -60
-        radius_units = u.deg
-        input_radius = 1.0
-        input_rows = 1
-
     # Mode for "normal" cone search
     if purpose == 'normal' and mode == 'cone':
         # Get the coordinates of the object in degrees
@@ -667,25 +792,35 @@ def get_data_via_astroquery(args, object_info, mode, purpose='normal'):
         inner_radius = args.inner_radius
         check_if_inner_and_ext_radius_are_valid(external_radius*external_radius_units, inner_radius*inner_radius_units)
 
+    # Several coordinates for a cone search: request all of them in a single job, instead of one cone search per
+    # coordinate
+    if mode == 'cone' and np.ndim(input_ra) > 0:
+        n_targets = len(input_ra)
+        radius_deg = u.Quantity(input_radius, radius_units).to_value(u.deg)
+        targets = Table({'target_id': np.arange(n_targets),
+                         'ra': np.asarray(input_ra, dtype=float),
+                         'dec': np.asarray(input_dec, dtype=float),
+                         'radius_deg': np.full(n_targets, radius_deg)})
+        return get_data_via_astroquery_batch(targets, service, input_rows)
+
     if mode == 'cone':
         ### Get data via Astroquery
         Gaia.MAIN_GAIA_TABLE = service 
         Gaia.ROW_LIMIT = input_rows 
-        p = log.progress(f'{colors["L_GREEN"]}Requesting data{colors["NC"]}')
-        logging.getLogger('astroquery').setLevel(logging.WARNING)
+        p = progressLog(f'{L_GREEN}Requesting data{NC}')
 
         # Make request to the service
         try:
-            p.status(f"{colors['PURPLE']}Querying table for '{service.replace('.gaia_source', '')}' service...{colors['NC']}")
+            p.status(f"{PURPLE}Querying table for '{service.replace('.gaia_source', '')}' service...{NC}")
             coord = SkyCoord(ra=input_ra, dec=input_dec, unit=(u.degree, u.degree), frame='icrs')
             radius = u.Quantity(input_radius, radius_units)
-            j = Gaia.cone_search_async(coord, radius)         
-            logging.getLogger('astroquery').setLevel(logging.INFO)
-        except:
-            p.failure(f"{colors['RED']}Error while trying to request data{colors['NC']}")
+            with quiet_astroquery_logs():
+                j = Gaia.cone_search_async(coord, radius)
+        except Exception:
+            p.failure(f"{RED}Error while trying to request data{NC}")
             sys.exit(1)
 
-        p.success(f"{colors['L_GREEN']}Data obtained!{colors['NC']}")
+        p.success(f"{L_GREEN}Data obtained!{NC}")
         # Get the final data to display its columns as a table
         r = j.get_results()
         return r 
@@ -693,48 +828,70 @@ def get_data_via_astroquery(args, object_info, mode, purpose='normal'):
         ### Get data via Astroquery
         Gaia.MAIN_GAIA_TABLE = service 
         Gaia.ROW_LIMIT = input_rows 
-        p = log.progress(f'{colors["L_GREEN"]}Requesting data{colors["NC"]}')
-        logging.getLogger('astroquery').setLevel(logging.WARNING)
+        p = progressLog(f'{L_GREEN}Requesting data{NC}')
         # Make request to the service
         try:
-            p.status(f"{colors['PURPLE']}Querying table for '{service.replace('.gaia_source', '')}' service...{colors['NC']}")
+            p.status(f"{PURPLE}Querying table for '{service.replace('.gaia_source', '')}' service...{NC}")
             coord = SkyCoord(ra=input_ra, dec=input_dec, unit=(u.degree, u.degree), frame='icrs')
             width = u.Quantity(input_width, width_units)
             height = u.Quantity(input_height, height_units)
-            r = Gaia.query_object_async(coordinate=coord, width=width, height=height)
-            logging.getLogger('astroquery').setLevel(logging.INFO)
-        except:
-            p.failure(f"{colors['RED']}Error while trying to request data{colors['NC']}")
+            with quiet_astroquery_logs():
+                r = Gaia.query_object_async(coordinate=coord, width=width, height=height)
+        except Exception:
+            p.failure(f"{RED}Error while trying to request data{NC}")
             sys.exit(1)
 
-        p.success(f"{colors['L_GREEN']}Data obtained!{colors['NC']}")
+        p.success(f"{L_GREEN}Data obtained!{NC}")
         return r
     if mode == 'ring':
         ### Get data via Astroquery
         Gaia.MAIN_GAIA_TABLE = service 
         Gaia.ROW_LIMIT = input_rows
-        p = log.progress(f"{colors['L_GREEN']}Requesting data{colors['NC']}")
-        logging.getLogger('astroquery').setLevel(logging.WARNING)
+        p = progressLog(f"{L_GREEN}Requesting data{NC}")
         # Make request to the service
         try:
             # First, make the request for the external radius, which is a normal cone
-            p.status(f"{colors['PURPLE']}Querying table for '{service.replace('.gaia_source', '')}' service...{colors['NC']}")
+            p.status(f"{PURPLE}Querying table for '{service.replace('.gaia_source', '')}' service...{NC}")
             coord = SkyCoord(ra=input_ra, dec=input_dec, unit=(u.degree, u.degree), frame='icrs')
             radius = u.Quantity(external_radius, external_radius_units)
-            j = Gaia.cone_search_async(coord, radius)         
-            logging.getLogger('astroquery').setLevel(logging.INFO)
-        except:
-            p.failure(f"{colors['RED']}Error while trying to request data for cone (external radius for ring){colors['NC']}")
+            with quiet_astroquery_logs():
+                j = Gaia.cone_search_async(coord, radius)
+        except Exception:
+            p.failure(f"{RED}Error while trying to request data for cone (external radius for ring){NC}")
             sys.exit(1)
         # Get the final data to display its columns as a table
         r = j.get_results()
         # Create a mask that filters data which is inside inner radius. So it excludes it
         inner_radius_mask = create_mask_for_inner_radius(r, input_ra, input_dec, inner_radius, inner_radius_units, p)
         final_data = r[inner_radius_mask]
-        p.success(f"{colors['L_GREEN']}Data obtained!{colors['NC']}")
+        p.success(f"{L_GREEN}Data obtained!{NC}")
         return final_data
 
 
+def get_data_via_astroquery_batch(targets: Table, service: str, row_limit: int = -1):
+    """
+    Get data for several cone searches at once. 'targets' must be a table with 'target_id', 'ra' and 'dec' (deg)
+    and 'radius_deg' (deg) columns. All the targets are uploaded and matched by the Archive in a single ADQL job,
+    instead of requesting one cone search per target. Every row returned has the 'target_id' it belongs to
+    """
+    from astroquery.gaia import Gaia
+    top = f"TOP {row_limit} " if row_limit > 0 else ""
+    query = f"""SELECT {top}g.*, t.target_id
+                FROM {service} AS g
+                JOIN tap_upload.targets AS t
+                ON 1 = CONTAINS(POINT('ICRS', g.ra, g.dec), CIRCLE('ICRS', t.ra, t.dec, t.radius_deg))"""
+    p = progressLog(f"{L_GREEN}Requesting data{NC}")
+    try:
+        p.status(f"{PURPLE}Querying table for '{service.replace('.gaia_source', '')}' service ({len(targets)} targets)...{NC}")
+        with quiet_astroquery_logs():
+            j = Gaia.launch_job_async(query=query, upload_resource=targets, upload_table_name='targets')
+    except Exception:
+        p.failure(f"{RED}Error while trying to request data{NC}")
+        sys.exit(1)
+    p.success(f"{L_GREEN}Data obtained!{NC}")
+    return j.get_results()
+
+
 def check_if_inner_and_ext_radius_are_valid(external_value, inner_value) -> None:
     """
     Check if the user provides a inner radius bigger than external radius for a ring, which cannot be possible
@@ -742,7 +899,7 @@ def check_if_inner_and_ext_radius_are_valid(external_value, inner_value) -> None
     if external_value > inner_value:
         return
     else:
-        print(f"{warning} {colors['RED']}The inner radius you provided ('{inner_value}') cannot be bigger than external radius ('{external_value}'{colors['NC']})")
+        print(f"{warning} {RED}The inner radius you provided ('{inner_value}') cannot be bigger than external radius ('{external_value}'{NC})")
         sys.exit(1)
 
 
@@ -750,6 +907,8 @@ def projected_distance_in_sky(point1_ra, point1_dec, point2_ra, point2_dec):
     """
     Projected distance in Sky
     """
+    import astropy.units as u
+    from astropy.coordinates import SkyCoord
     c1 = SkyCoord(point1_ra, point1_dec, unit=(u.degree, u.degree), frame='icrs')
     c2 = SkyCoord(point2_ra, point2_dec, unit=(u.degree, u.degree), frame='icrs')
     return c1.separation(c2) # separation in 'deg'
@@ -763,7 +922,7 @@ def print_percentage(total, current_value) ->str:
 
 
 def create_mask_for_inner_radius(original_data, coord_ra, coord_dec, inner_radius, inner_radius_units, p, nsteps=400):
-    message = f"{colors['GREEN']}Creating ring/annulus from Cone Search...{colors['NC']}"
+    message = f"{GREEN}Creating ring/annulus from Cone Search...{NC}"
     p.status(message)
     # Give 2 seconds to read the message
     time.sleep(2)
@@ -779,32 +938,34 @@ def create_mask_for_inner_radius(original_data, coord_ra, coord_dec, inner_radiu
             filter_mask.append(True)
         # Print process every 400 steps
         if index%nsteps == 0:
-            p.status(f"{message} ({colors['PURPLE']}{print_percentage(original_length, index)}{colors['NC']})")
+            p.status(f"{message} ({PURPLE}{print_percentage(original_length, index)}{NC})")
     if original_length != len(filter_mask):
-        print(f"{warning} {colors['RED']}The Mask used to filter Inner Radius data has a different size ({len(filter_mask)}) compared to original data ({len(original_data)}){colors['NC']}.")
+        print(f"{warning} {RED}The Mask used to filter Inner Radius data has a different size ({len(filter_mask)}) compared to original data ({len(original_data)}){NC}.")
         sys.exit(1)
     return filter_mask
 
 
-def get_content_table_to_display(data):
+# LaTeX markup found in Gaia descriptions: '$', '{\rm' and '}'
+latex_markup_pattern = re.compile(r'\$|\{\\rm|\}')
+
+
+def get_content_table_to_display(columns):
     """
-    Get the content obtained via Astroquery and set it into a table-readable format, replacing some invalid/null values
+    Get the columns metadata obtained via Astroquery and set it into a table-readable format (an array where every
+    element is a row of the table), replacing some invalid/null values
     """
-    output = ""
     output_list = []
-    # Clean the data
-    for j in range(0, len(data.colnames)):
-        prop = data.colnames[j]
+    for j, column in enumerate(columns, start=1):
         # Set a value for 'unknown'/not set units
-        if data[prop].info.unit == None:
-            data[prop].info.unit = "-"
+        unit = column.unit or "-"
+        description = column.description
         # Clean '{\rm}', '$' and '}' characters from output
-        if isinstance(data[prop].info.description, str):
-            data[prop].info.description = data[prop].info.description.replace('$', '').replace('{\\rm','').replace("}",'')
+        if isinstance(description, str):
+            description = latex_markup_pattern.sub('', description)
         # If no description is provided, say it
-        if isinstance(data[prop].info.description, type(None)):
-            data[prop].info.description = "No description provided"
-        output_list.append(f'{j+1} | {data[prop].info.name} | {data[prop].info.dtype} | {data[prop].info.unit} | {data[prop].info.description}')
+        elif description is None:
+            description = "No description provided"
+        output_list.append([str(j), column.name, str(column.datatype), str(unit), description.strip()])
     return output_list
 
 
@@ -818,12 +979,12 @@ def check_if_filename_flag_was_provided(args)->bool | None:
         return True
     # If the user has not provided it, then we will have to if some flags has been provided
     if args.file is None:
-        print(f"{sb} {colors['PURPLE']}Filename not provided ('-f'). Attempting to use other parameters provided...{colors['NC']}")
+        print(f"{sb} {PURPLE}Filename not provided ('-f'). Attempting to use other parameters provided...{NC}")
     if args.name is None:
-        print(f"{warning} {colors['RED']}No name provided to object ('-n' or '--name'). Provide a valid value to this parameter and retry.{colors['NC']}")
+        print(f"{warning} {RED}No name provided to object ('-n' or '--name'). Provide a valid value to this parameter and retry.{NC}")
         sys.exit(1)
     if args.radii is None:
-        print(f"{warning} {colors['RED']}No radius provided ('-r' or '--radii'). Provide a valid value to this parameter and retry.{colors['NC']}")
+        print(f"{warning} {RED}No radius provided ('-r' or '--radii'). Provide a valid value to this parameter and retry.{NC}")
         sys.exit(1)
     # If the user has provided all of these parameters, then just return a boolean 
     # to indicate we will have to use them in future steps
@@ -837,16 +998,20 @@ def showGaiaContent(args) -> None:
     displaySections('show-gaia-content', randomColor(), randomChar())
     # Get table format to display the content
     table_format = args.table_format
-    # Create a random 'objectInfo' object just to fill
-    object_example = objectInfo(name='', RA=280, DEC=-60, pmra=0.0, pmdec=0.0, identifiedAs="Other")
-    # Get an example data
-    data = get_data_via_astroquery(args, object_example, 'cone', 'content')
-    # Get the data into a table format
-    output_list = get_content_table_to_display(data)
+    # Columns of a Gaia release never change, so they are requested only once and then read from cache
+    service = select_gaia_astroquery_service(args.gaia_release)
+    content_cache_file = gaia_content_cache_file.format(service=service)
+    try:
+        with open(content_cache_file) as file:
+            printable_data_table = json.load(file)
+    except (OSError, ValueError):
+        # Only the metadata of the table is requested, no data
+        columns = get_gaia_table_columns(service)
+        # Get the data for the table (an array where every element is a row of the table)
+        printable_data_table = get_content_table_to_display(columns)
+        write_cache_file(content_cache_file, json.dumps(printable_data_table))
     # To display the table first we need to get terminal width
-    width = shutil.get_terminal_size()[0]
-    # Get the data for the table (an array where every element is a row of the table)
-    printable_data_table = read_columns_in_gaia_table(output_list)
+    width = get_terminal_width()
     # Create table body that will be printed
     headers_table, body_table, max_allowed_length = create_table_elements(width, printable_data_table)
     # Print the obtained table
@@ -857,52 +1022,87 @@ def showGaiaContent(args) -> None:
 ##### extract ######
 ####################
 
+@functools.lru_cache(maxsize=1)
+def load_resolved_names_cache() -> dict:
+    """
+    Load coordinates of objects resolved by name in previous runs, as {name: [RA, DEC]} in degrees
+    """
+    try:
+        with open(resolved_names_cache_file) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_resolved_names_cache(resolved_names: dict) -> None:
+    """
+    Save (atomically) the coordinates of objects resolved by name
+    """
+    write_cache_file(resolved_names_cache_file, json.dumps(resolved_names))
+
+
 def get_object_coordinates(object_name):
     """
-    Get the coordinates using service from Strasbourg astronomical Data Center (http://cdsweb.u-strasbg.fr)
+    Get the coordinates using service from Strasbourg astronomical Data Center (http://cdsweb.u-strasbg.fr).
+    Coordinates already resolved in previous runs are read from cache, without any request
     """
+    import astropy.units as u
+    from astropy.coordinates import SkyCoord
+    from astropy.coordinates.name_resolve import NameResolveError
+    resolved_names = load_resolved_names_cache()
+    cached_coords = resolved_names.get(object_name.lower())
+    if cached_coords is not None:
+        return SkyCoord(ra=cached_coords[0], dec=cached_coords[1], unit=(u.degree, u.degree), frame='icrs'), True
     try:
-        # Use the SkyCoord.from_name() function to get the coordinates
-        object_coord = SkyCoord.from_name(object_name)
+        # Use the SkyCoord.from_name() function to get the coordinates. Names with embedded coordinates
+        # (e.g., '2MASS J06495091-0737408') are parsed locally; the online service is used otherwise
+        object_coord = SkyCoord.from_name(object_name, parse=True, cache=True)
         found_object = True
     except NameResolveError:
         found_object = False
         return None, found_object
+    resolved_names[object_name.lower()] = [object_coord.ra.degree, object_coord.dec.degree]
+    save_resolved_names_cache(resolved_names)
     return object_coord, found_object
 
 
 def try_to_extract_angles(coord_parameter):
+    from astropy.coordinates import Angle
+    from astropy.units.core import UnitsError
     try:
         coord_parameter_angle = Angle(coord_parameter)
         return coord_parameter_angle.dec, True
     except UnitsError:
         coord_parameter_angle = Angle(coord_parameter, unit='deg')
         return coord_parameter_angle, True
-    except:
+    except (ValueError, TypeError):
         return None, False
 
 def decide_coords(args, print_process=True):
     """
     Based if the object provided by the user was found or not, decide what coordinates the program will use
     """
+    import astropy.units as u
+    from astropy.coordinates import SkyCoord
+    from astropy.units.core import UnitsError
     if print_process:
-        p = log.progress(f'{colors["L_GREEN"]}Obtaining coordinates for object{colors["NC"]}')
+        p = progressLog(f'{L_GREEN}Obtaining coordinates for object{NC}')
     object_coordinates, found_object = get_object_coordinates(args.name)
     if found_object:
         if print_process:
-            p.success(f'{colors["GREEN"]}Coords found in Archive{colors["NC"]}')
+            p.success(f'{GREEN}Coords found in Archive{NC}')
         return object_coordinates.ra, object_coordinates.dec
     if not found_object:
         # Check if the user has provided parameters so we can extract the coordinates manually
         if args.right_ascension is None:
-            print(f"{warning}{colors['RED']} Invalid object name ('{args.name}') and Right Ascension not provided ('--right-ascension')")
+            print(f"{warning}{RED} Invalid object name ('{args.name}') and Right Ascension not provided ('--right-ascension')")
             sys.exit(1)
         if args.declination is None:
-            print(f"{warning}{colors['RED']} Invalid object name ('{args.name}') and Declination not provided ('--declination')")
+            print(f"{warning}{RED} Invalid object name ('{args.name}') and Declination not provided ('--declination')")
             sys.exit(1)
         # If the user has provided coordinates, use them
         if print_process:
-            p.failure(f"{colors['RED']} Object could not be found in Archives (astropy). Using coordinates provided by the user instead{colors['NC']}")
+            p.failure(f"{RED} Object could not be found in Archives (astropy). Using coordinates provided by the user instead{NC}")
         # Try to create SkyCoord with provided units
         RA, DEC = args.right_ascension, args.declination
         try:
@@ -910,8 +1110,8 @@ def decide_coords(args, print_process=True):
         except UnitsError:
             # Assume default units (degrees) if no units are specified
             coord_manual = SkyCoord(ra=RA, dec=DEC, unit=(u.deg, u.deg))
-        except:
-            print(f"{warning} {colors['RED']}Unable to convert coordinates provided (RA '{args.right_ascension}' and DEC '{args.declination}') to degree units. Review your input and retry...{colors['NC']}")
+        except (ValueError, TypeError):
+            print(f"{warning} {RED}Unable to convert coordinates provided (RA '{args.right_ascension}' and DEC '{args.declination}') to degree units. Review your input and retry...{NC}")
             sys.exit(1)
         return coord_manual.ra.degree, coord_manual.dec.degree
             
@@ -928,21 +1128,28 @@ class astroStudy:
     page: str
     study_url: str
     data_url: str
+    reference: str = field(init=False, repr=False)
 
-    def show_study(self) -> str:
+    def __post_init__(self):
         """
-        Prints the classic "Author & Author 2 (2024)" or "Author et al. (2024)"
+        Studies do not change, so the classic "Author & Author 2 (2024)" or "Author et al. (2024)" is set only once
         """
         if len(self.authors) <= 2:
             author1 = self.authors[0].split(',')[0]
             author2 = self.authors[1].split(',')[0]
-            return f"{author1} & {author2} ({self.year}, {self.magazine}, {self.vol}, {self.page})"
+            self.reference = f"{author1} & {author2} ({self.year}, {self.magazine}, {self.vol}, {self.page})"
         else:
             first_author = self.authors[0].split(',')[0]
-            return f"{first_author} et al. ({self.year}, {self.magazine}, {self.vol}, {self.page})"
+            self.reference = f"{first_author} et al. ({self.year}, {self.magazine}, {self.vol}, {self.page})"
 
+    def show_study(self) -> str:
+        """
+        Prints the classic "Author & Author 2 (2024)" or "Author et al. (2024)"
+        """
+        return self.reference
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True, frozen=True)
 class onlineVasilievObject:
     """
     Create a data structure for data obtained from Vasiliev & Baumgardt (2021, MNRAS, 505, 5978V)
@@ -961,170 +1168,269 @@ class onlineVasilievObject:
     nstar:int  # number of Gaia-detected cluster stars
 
 
-def get_extra_object_info_globular_cluster(args, p):
+# Study (and catalog) for Globular Clusters
+vasiliev_baumgardt_study = astroStudy(authors=["Vasiliev, E.", "Baumgardt, H."],
+                                      year=2021, magazine="MNRAS",
+                                      vol="505", page="597V",
+                                      study_url='https://ui.adsabs.harvard.edu/abs/2021MNRAS.505.5978V/abstract',
+                                      data_url='https://cdsarc.cds.unistra.fr/ftp/J/MNRAS/505/5978/tablea1.dat')
+
+
+def read_cached_catalog(cache_file: str) -> str:
     """
-    Request Globular Cluster data from Vasiliev & Baumgardt (2021, MNRAS, 505, 5978V) if available
+    Read a catalog previously saved in cache directory
     """
-    # Check data from Vasiliev & Baumgardt (2021, MNRAS, 505, 5978V)
-    vasiliev_baumgardt_study = astroStudy(authors=["Vasiliev, E.", "Baumgardt, H."],
-                                         year=2021, magazine="MNRAS",
-                                         vol="505", page="597V",
-                                         study_url='https://ui.adsabs.harvard.edu/abs/2021MNRAS.505.5978V/abstract',
-                                         data_url='https://cdsarc.cds.unistra.fr/ftp/J/MNRAS/505/5978/tablea1.dat')
+    with open(cache_file) as file:
+        return file.read()
 
-    p.status(f"{colors['GREEN']}Requesting data from {vasiliev_baumgardt_study.show_study()}{colors['NC']}")
 
-    response = requests.get(vasiliev_baumgardt_study.data_url)
+def write_cache_file(cache_file: str, content: str) -> None:
+    """
+    Save a file in cache directory atomically, so an interrupted run does not leave a broken cached file.
+    Cache is optional, so errors are ignored
+    """
+    try:
+        os.makedirs(catalogs_cache_dir, exist_ok=True)
+        file_descriptor, tmp_path = tempfile.mkstemp(dir=catalogs_cache_dir)
+        with os.fdopen(file_descriptor, 'w') as file:
+            file.write(content)
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=1)
+def get_requests_session():
+    """
+    Session shared by all the requests to catalogs, so connections to the same server are reused
+    """
+    # Imported here since it is only needed when a catalog must be requested
+    import requests
+    return requests.Session()
 
-    # Check the HTTP status code
-    if response.status_code == 200:
-        # Read the content of the response
-        source_code = response.text
 
-        # Split the source code into lines
-        lines = source_code.splitlines()
+def get_catalog_cache_file(url: str) -> str:
+    """
+    Path where an online catalog is saved in cache directory
+    """
+    # Key the cached file by the full url, keeping the original filename to make it readable
+    url_hash = hashlib.sha1(url.encode()).hexdigest()[:12]
+    return os.path.join(catalogs_cache_dir, f"{url_hash}_{os.path.basename(url)}")
+
+
+@functools.lru_cache(maxsize=8)
+def request_catalog_content(url: str, ttl_days: float = 30.) -> str | None:
+    """
+    Get the content of an online catalog. Catalogs barely change, so they are saved in cache directory
+    and only requested again after 'ttl_days' days (and only downloaded if they were modified, based on their ETag
+    or last modification date).
+    The content is also kept in memory, so a catalog is obtained only once per run.
+    Returns 'None' if the catalog could not be obtained
+    """
+    cache_file = get_catalog_cache_file(url)
+    try:
+        cache_mtime = os.path.getmtime(cache_file)
+    except OSError:
+        cache_mtime = None
+    # If the cached catalog is recent enough, just use it
+    if cache_mtime is not None and time.time() - cache_mtime < ttl_days * 86400.:
+        return read_cached_catalog(cache_file)
+    # Otherwise request it, asking the server to send it only if it has been modified
+    etag_file = f"{cache_file}.etag"
+    headers = {}
+    if cache_mtime is not None:
+        headers['If-Modified-Since'] = formatdate(cache_mtime, usegmt=True)
+        try:
+            headers['If-None-Match'] = read_cached_catalog(etag_file)
+        except OSError:
+            pass
+    session = get_requests_session()
+    try:
+        response = session.get(url, headers=headers, timeout=catalog_request_timeout)
+    # 'requests' exceptions are subclasses of OSError
+    except OSError:
+        response = None
+    if response is not None and response.status_code == 304:
+        # Not modified, so the cached catalog is still valid for another period
+        try:
+            os.utime(cache_file)
+        except OSError:
+            pass
+        return read_cached_catalog(cache_file)
+    if response is None or response.status_code != 200:
+        # If the source cannot be reached, an outdated catalog is better than nothing
+        return read_cached_catalog(cache_file) if cache_mtime is not None else None
+    # Catalogs are plain ASCII files, so decode them directly instead of letting 'requests' guess their encoding
+    # (which scans the whole catalog)
+    content = response.content.decode('ascii', errors='replace')
+    write_cache_file(cache_file, content)
+    # Keep the ETag (if the server sends one) to validate the cached catalog next time
+    etag = response.headers.get('ETag')
+    if etag is not None:
+        write_cache_file(etag_file, etag)
+    return content
+
+
+# Characters ignored when comparing object names: '_', '-' and whitespaces
+object_name_separators_pattern = re.compile(r'[_\-\s]+')
+
+
+def canonical_object_name(object_name: str) -> str:
+    """
+    Lowercase object name without separators, so 'NGC 104', 'ngc_104' and 'NGC-104' are all found as 'ngc104'
+    """
+    return object_name_separators_pattern.sub('', object_name.lower())
+
 
+def load_catalog_index(url: str, build_index, ttl_days: float = 30.) -> dict | None:
+    """
+    Get the index of an online catalog, built by 'build_index' from the catalog content. The built index is saved
+    in cache directory, so the catalog is not read and indexed again while the cached catalog is still valid.
+    Returns 'None' if the catalog could not be obtained
+    """
+    cache_file = get_catalog_cache_file(url)
+    index_file = f"{cache_file}.index.json"
+    # The saved index is valid if the cached catalog is recent enough and the index was built after it was obtained
+    try:
+        cache_mtime = os.path.getmtime(cache_file)
+        if time.time() - cache_mtime < ttl_days * 86400. and os.path.getmtime(index_file) >= cache_mtime:
+            with open(index_file) as file:
+                return json.load(file)
+    except (OSError, ValueError):
+        pass
+    source_code = request_catalog_content(url, ttl_days)
+    if source_code is None:
+        return None
+    catalog_index = build_index(source_code)
+    write_cache_file(index_file, json.dumps(catalog_index))
+    return catalog_index
+
+
+# Globular Clusters with a single word name in Vasiliev & Baumgardt (2021) catalog
+vasiliev_single_name_objects = frozenset(('eridanus', 'pyxis', 'crater'))
+
+
+def build_vasiliev_catalog_index(source_code: str) -> dict[str, list[str]]:
+    """
+    Index the rows (split into columns) of Vasiliev & Baumgardt (2021, MNRAS, 505, 5978V) catalog by the canonical
+    form of their names
+    """
+    catalog_index = {}
+    for line in source_code.splitlines():
+        # Split the line into columns
+        columns = line.split()
+        n_columns = len(columns)
         # Objects with a single word name
-        exceptions_object_names = ['Eridanus', 'Pyxis', 'Crater']
-
-        # Iterate over each line
-        for line in lines:
-            # Split the line into columns
-            columns = line.split()
-            single_name_condition = columns[0].lower() == args.name.lower() and args.name.lower() in [exception_object.lower() for exception_object in exceptions_object_names]
-            single_name_condition = single_name_condition and len(columns) == 12
-
-            if single_name_condition:
-                vasiliev_name = columns[0]
-                vasiliev_ra = float(columns[1])
-                vasiliev_dec = float(columns[2])
-                vasiliev_pmra = float(columns[3])
-                vasiliev_e_pmra = float(columns[4])
-                vasiliev_pmdec = float(columns[5])
-                vasiliev_e_pmdec = float(columns[6])
-                vasiliev_parallax = float(columns[8])
-                vasiliev_e_parallax = float(columns[9])
-                vasiliev_rscale = float(columns[10])
-                vasiliev_nstar = int(columns[11])
-                vasiliev_object = onlineVasilievObject(name=vasiliev_name,
-                                                       ra=vasiliev_ra,
-                                                       dec=vasiliev_dec,
-                                                       pmra=vasiliev_pmra,
-                                                       e_pmra=vasiliev_e_pmra,
-                                                       pmdec=vasiliev_pmdec,
-                                                       e_pmdec=vasiliev_e_pmdec,
-                                                       parallax=vasiliev_parallax,
-                                                       e_parallax=vasiliev_e_parallax,
-                                                       rscale=vasiliev_rscale,
-                                                       nstar=vasiliev_nstar)
-                p.success(f"{colors['GREEN']}Data succesfully found and extracted from {colors['PURPLE']}{vasiliev_baumgardt_study.show_study()} {colors['NC']}")
-                return True, vasiliev_object
-
-            # There is, literally, 1 line with an alternative name with only 1 component '1636-283'
-            special_case_condition =  (args.name.lower() == '1636-283' or args.name.lower == '1636 283') and columns[2] == '1636-283'
-            special_case_condition = special_case_condition and len(columns) == 14
-            if special_case_condition:
-                vasiliev_name = f"{columns[0]} {columns[1]}"
-                vasiliev_opt_name = f"{columns[2]}"
-                vasiliev_ra = float(columns[3])
-                vasiliev_dec = float(columns[4])
-                vasiliev_pmra = float(columns[5])
-                vasiliev_e_pmra = float(columns[6])
-                vasiliev_pmdec = float(columns[7])
-                vasiliev_e_pmdec = float(columns[8])
-                vasiliev_parallax = float(columns[10])
-                vasiliev_e_parallax = float(columns[11])
-                vasiliev_rscale = float(columns[12])
-                vasiliev_nstar = int(columns[13])
-                vasiliev_object = onlineVasilievObject(name=vasiliev_name,
-                                                       opt_name=vasiliev_opt_name,
-                                                       ra=vasiliev_ra,
-                                                       dec=vasiliev_dec,
-                                                       pmra=vasiliev_pmra,
-                                                       e_pmra=vasiliev_e_pmra,
-                                                       pmdec=vasiliev_pmdec,
-                                                       e_pmdec=vasiliev_e_pmdec,
-                                                       parallax=vasiliev_parallax,
-                                                       e_parallax=vasiliev_e_parallax,
-                                                       rscale=vasiliev_rscale,
-                                                       nstar=vasiliev_nstar)
-                p.success(f"{colors['GREEN']}Data found as {colors['RED']}Globular Cluster{colors['GREEN']} from {colors['PURPLE']}{vasiliev_baumgardt_study.show_study()} {colors['NC']}")
-                return True, vasiliev_object
+        if n_columns == 12:
+            object_names = (columns[0],) if columns[0].lower() in vasiliev_single_name_objects else ()
+        # There is, literally, 1 line with an alternative name with only 1 component '1636-283'
+        elif n_columns == 14 and columns[2] == '1636-283':
+            object_names = (columns[2],)
+        # Objects with 2 component name, for example "NGC" and a number
+        elif n_columns == 13:
+            object_names = (columns[0] + columns[1],)
+        # Objects with 2 component name and an alternative name
+        elif n_columns == 15:
+            object_names = (columns[0] + columns[1], columns[2] + columns[3])
+        else:
+            continue
+        # If a name is repeated, keep the first row where it was found
+        for object_name in object_names:
+            catalog_index.setdefault(canonical_object_name(object_name), columns)
+    return catalog_index
 
-        
-            # Objects with 2 component name, for example "NGC" and a number and an alternative name
-            possible_object_names = [f"{columns[0].lower()}{columns[1].lower()}", 
-                                     f"{columns[0].lower()} {columns[1].lower()}", 
-                                     f"{columns[2].lower()}{columns[3].lower()}", 
-                                     f"{columns[2].lower()} {columns[3].lower()}"]
-            
-            no_alternatives_names_condition = args.name.lower() in possible_object_names and len(columns) == 13
-            if no_alternatives_names_condition:
-                vasiliev_name = f"{columns[0]} {columns[1]}"
-                vasiliev_ra = float(columns[2])
-                vasiliev_dec = float(columns[3])
-                vasiliev_pmra = float(columns[4])
-                vasiliev_e_pmra = float(columns[5])
-                vasiliev_pmdec = float(columns[6])
-                vasiliev_e_pmdec = float(columns[7])
-                vasiliev_parallax = float(columns[9])
-                vasiliev_e_parallax = float(columns[10])
-                vasiliev_rscale = float(columns[11])
-                vasiliev_nstar = int(columns[12])
-                vasiliev_object = onlineVasilievObject(name=vasiliev_name,
-                                                       ra=vasiliev_ra,
-                                                       dec=vasiliev_dec,
-                                                       pmra=vasiliev_pmra,
-                                                       e_pmra=vasiliev_e_pmra,
-                                                       pmdec=vasiliev_pmdec,
-                                                       e_pmdec=vasiliev_e_pmdec,
-                                                       parallax=vasiliev_parallax,
-                                                       e_parallax=vasiliev_e_parallax,
-                                                       rscale=vasiliev_rscale,
-                                                       nstar=vasiliev_nstar)
-                p.success(f"{colors['GREEN']}Data found as {colors['RED']}Globular Cluster{colors['GREEN']} from {colors['PURPLE']}{vasiliev_baumgardt_study.show_study()} {colors['NC']}")
-                return True, vasiliev_object
-                
-
-            multiple_name_condition = args.name.lower() in possible_object_names and len(columns) == 15
-            if multiple_name_condition:
-                vasiliev_name = f"{columns[0]} {columns[1]}"
-                vasiliev_opt_name = f"{columns[2]} {columns[3]}"
-                vasiliev_ra = float(columns[4])
-                vasiliev_dec = float(columns[5])
-                vasiliev_pmra = float(columns[6])
-                vasiliev_e_pmra = float(columns[7])
-                vasiliev_pmdec = float(columns[8])
-                vasiliev_e_pmdec = float(columns[9])
-                vasiliev_parallax = float(columns[11])
-                vasiliev_e_parallax = float(columns[12])
-                vasiliev_rscale = float(columns[13])
-                vasiliev_nstar = int(columns[14])
-                vasiliev_object = onlineVasilievObject(name=vasiliev_name,
-                                                       opt_name=vasiliev_opt_name,
-                                                       ra=vasiliev_ra,
-                                                       dec=vasiliev_dec,
-                                                       pmra=vasiliev_pmra,
-                                                       e_pmra=vasiliev_e_pmra,
-                                                       pmdec=vasiliev_pmdec,
-                                                       e_pmdec=vasiliev_e_pmdec,
-                                                       parallax=vasiliev_parallax,
-                                                       e_parallax=vasiliev_e_parallax,
-                                                       rscale=vasiliev_rscale,
-                                                       nstar=vasiliev_nstar)
-                p.success(f"{colors['GREEN']}Data found as {colors['RED']}Globular Cluster{colors['GREEN']} from {colors['PURPLE']}{vasiliev_baumgardt_study.show_study()} {colors['NC']}")
-                return True, vasiliev_object
-
-    if response.status_code != 200:
-        p.status(f"{colors['RED']}Unable to reach the data source website ('{vasiliev_baumgardt_study.data_url}'). Check your internet connection and retry.{colors['NC']}")
-        time.sleep(2)
+
+@functools.lru_cache(maxsize=1)
+def load_vasiliev_catalog_index() -> dict[str, list[str]] | None:
+    """
+    Read Vasiliev & Baumgardt (2021, MNRAS, 505, 5978V) catalog only once, indexing its rows by the canonical form of
+    their names. Returns 'None' if the catalog could not be obtained
+    """
+    return load_catalog_index(vasiliev_baumgardt_study.data_url, build_vasiliev_catalog_index)
+
+
+def build_vasiliev_object(columns: list[str], name: str, opt_name: str = '') -> onlineVasilievObject:
+    """
+    Create a Vasiliev & Baumgardt (2021) object from a catalog row. The last 11 columns of every row are always
+    RA, DEC, PMRA, e_PMRA, PMDEC, e_PMDEC, PMRA-PMDEC correlation, parallax, e_parallax, rscale and Nstar
+    """
+    ra, dec, pmra, e_pmra, pmdec, e_pmdec, _, parallax, e_parallax, rscale = map(float, columns[-11:-1])
+    return onlineVasilievObject(name=name, opt_name=opt_name, ra=ra, dec=dec, pmra=pmra, e_pmra=e_pmra,
+                                pmdec=pmdec, e_pmdec=e_pmdec, parallax=parallax, e_parallax=e_parallax,
+                                rscale=rscale, nstar=int(columns[-1]))
+
+
+def parse_vasiliev_single_name_row(columns: list[str]) -> onlineVasilievObject:
+    """
+    Single word name (12 columns)
+    """
+    return build_vasiliev_object(columns, columns[0])
+
+
+def parse_vasiliev_two_component_name_row(columns: list[str]) -> onlineVasilievObject:
+    """
+    2 component name without an alternative name (13 columns)
+    """
+    return build_vasiliev_object(columns, f"{columns[0]} {columns[1]}")
+
+
+def parse_vasiliev_1636_283_row(columns: list[str]) -> onlineVasilievObject:
+    """
+    The object with '1636-283' alternative name (14 columns)
+    """
+    return build_vasiliev_object(columns, f"{columns[0]} {columns[1]}", columns[2])
+
+
+def parse_vasiliev_alternative_name_row(columns: list[str]) -> onlineVasilievObject:
+    """
+    2 component name with an alternative name (15 columns)
+    """
+    return build_vasiliev_object(columns, f"{columns[0]} {columns[1]}", f"{columns[2]} {columns[3]}")
+
+
+# Functions that read a row of Vasiliev & Baumgardt (2021) catalog based on its number of columns
+vasiliev_row_parsers = {12: parse_vasiliev_single_name_row,
+                        13: parse_vasiliev_two_component_name_row,
+                        14: parse_vasiliev_1636_283_row,
+                        15: parse_vasiliev_alternative_name_row}
+
+
+@functools.lru_cache(maxsize=256)
+def find_vasiliev_object(canonical_name: str) -> onlineVasilievObject | None:
+    """
+    Get data for an object (by the canonical form of its name) from Vasiliev & Baumgardt (2021, MNRAS, 505, 5978V)
+    catalog. Every object is read only once, so the same object requested again is returned right away.
+    Returns 'None' if the object is not in the catalog (or it could not be obtained)
+    """
+    catalog_index = load_vasiliev_catalog_index()
+    columns = catalog_index.get(canonical_name) if catalog_index is not None else None
+    if columns is None:
+        return None
+    return vasiliev_row_parsers[len(columns)](columns)
+
+
+def get_extra_object_info_globular_cluster(args, p):
+    """
+    Request Globular Cluster data from Vasiliev & Baumgardt (2021, MNRAS, 505, 5978V) if available
+    """
+    study_reference = vasiliev_baumgardt_study.show_study()
+    # Check data from Vasiliev & Baumgardt (2021, MNRAS, 505, 5978V)
+    p.status(f"{GREEN}Requesting data from {study_reference}{NC}")
+
+    # Check if the catalog could be obtained
+    if load_vasiliev_catalog_index() is None:
+        p.failure(f"{RED}Unable to reach the data source website ('{vasiliev_baumgardt_study.data_url}'). Check your internet connection and retry.{NC}")
         return False, None
-    p.status(f"{colors['RED']}Data not found for '{args.name}' in {vasiliev_baumgardt_study.show_study()}. Continuing...{colors['NC']}")
-    time.sleep(2)
-    return False, None
 
+    vasiliev_object = find_vasiliev_object(canonical_object_name(args.name))
+    if vasiliev_object is None:
+        p.status(f"{RED}Data not found for '{args.name}' in {study_reference}. Continuing...{NC}")
+        return False, None
+    p.success(f"{GREEN}Data found as {RED}Globular Cluster{GREEN} from {PURPLE}{study_reference} {NC}")
+    return True, vasiliev_object
 
-@dataclass(kw_only=True)
+
+@dataclass(kw_only=True, slots=True, frozen=True)
 class onlineCantanObject:
     """
     Object to store data extracted from Cantat-Gaudin et al. (2020, A&A, 640, A1)
@@ -1148,114 +1454,129 @@ class onlineCantanObject:
     rgc : float # distance from galaxy center, assuming the distance is 8340 pc (pc)
 
     
+# Study (and catalog) for Open Clusters
+cantat_gaudin_study = astroStudy(authors=["Cantat-Gaudin, T.", "Anders, F.", "Castro-Ginard, A.","Jordi, C.",
+                                          "Romero-Gómez, M.","Soubiran, C.","Casamiquela, L.","Tarricq, Y."
+                                          ,"Moitinho, A.","Vallenari, A.","Bragaglia, A.","Krone-Martins, A.",
+                                          "Kounkel, M."], 
+                                 year=2020, 
+                                 magazine="A&A", 
+                                 vol="640", 
+                                 page="A1",
+                                 study_url='https://ui.adsabs.harvard.edu/abs/2020A%26A...640A...1C/abstract',
+                                 data_url='https://cdsarc.cds.unistra.fr/ftp/J/A+A/640/A1/table1.dat')
+
+
+def build_cantat_gaudin_catalog_index(source_code: str) -> dict[str, str]:
+    """
+    Index the rows (lines) of Cantat-Gaudin et al. (2020, A&A, 640, A1) catalog by the canonical form of their names
+    """
+    catalog_index = {}
+    for line in source_code.splitlines():
+        # Only the name (first column) is needed to index the row, the rest of the line is split only if requested
+        name_and_values = line.split(None, 1)
+        if not name_and_values:
+            continue
+        # If a name is repeated, keep the first row where it was found
+        catalog_index.setdefault(canonical_object_name(name_and_values[0]), line)
+    return catalog_index
+
+
+@functools.lru_cache(maxsize=1)
+def load_cantat_gaudin_catalog_index() -> dict[str, str] | None:
+    """
+    Read Cantat-Gaudin et al. (2020, A&A, 640, A1) catalog only once, indexing its rows by the canonical form of
+    their names. Returns 'None' if the catalog could not be obtained
+    """
+    return load_catalog_index(cantat_gaudin_study.data_url, build_cantat_gaudin_catalog_index)
+
+
+@functools.lru_cache(maxsize=256)
+def find_cantat_gaudin_object(canonical_name: str) -> onlineCantanObject | None:
+    """
+    Get data for an object (by the canonical form of its name) from Cantat-Gaudin et al. (2020, A&A, 640, A1)
+    catalog. Every object is read only once, so the same object requested again is returned right away.
+    Returns 'None' if the object is not in the catalog (or it could not be obtained)
+    """
+    catalog_index = load_cantat_gaudin_catalog_index()
+    line = catalog_index.get(canonical_name) if catalog_index is not None else None
+    if line is None:
+        return None
+    # Read all the columns needed at once
+    (name, ra, dec, _, _, r50, n_stars, pmra, e_pmra, pmdec, e_pmdec, parallax, e_parallax, _,
+     log_age, a_v, d_modulus, distance, *_, rgc) = line.split()
+    name = name.replace('_',' ')
+    ra, dec, r50 = float(ra), float(dec), float(r50)
+    n_stars = int(n_stars)
+    pmra, e_pmra, pmdec, e_pmdec = float(pmra), float(e_pmra), float(pmdec), float(e_pmdec)
+    parallax, e_parallax = float(parallax), float(e_parallax)
+    # Since some values in Cantat-Gaudin et al. study are filled with '---' values, if it that is the case
+    # fill them with -9999 (similar as was done for APOGEE survey)
+    try:
+        log_age, a_v, d_modulus, distance, rgc = map(float, (log_age, a_v, d_modulus, distance, rgc))
+    except ValueError:
+        log_age, a_v, d_modulus, distance, rgc = -9999., -9999., -9999., -9999., -9999.
+    cantat_object = onlineCantanObject(name=name,
+                                       ra = ra,
+                                       dec = dec,
+                                       r50 = r50,
+                                       n_stars=n_stars,
+                                       pmra = pmra,
+                                       e_pmra = e_pmra,
+                                       pmdec = pmdec,
+                                       e_pmdec = e_pmdec,
+                                       parallax = parallax,
+                                       e_parallax = e_parallax,
+                                       log_age = log_age,
+                                       a_v = a_v,
+                                       d_modulus=d_modulus,
+                                       distance=distance,
+                                       rgc=rgc)
+    return cantat_object
+
+
 def get_extra_object_info_open_cluster(args, p, set_warning=True):
     """
     Request Open Cluster data from Cantat-Gaudin et al. (2020, A&A, 640, A1) if available
     """
-    cantat_gaudin_study = astroStudy(authors=["Cantat-Gaudin, T.", "Anders, F.", "Castro-Ginard, A.","Jordi, C.",
-                                              "Romero-Gómez, M.","Soubiran, C.","Casamiquela, L.","Tarricq, Y."
-                                              ,"Moitinho, A.","Vallenari, A.","Bragaglia, A.","Krone-Martins, A.",
-                                              "Kounkel, M."], 
-                                     year=2020, 
-                                     magazine="A&A", 
-                                     vol="640", 
-                                     page="A1",
-                                     study_url='https://ui.adsabs.harvard.edu/abs/2020A%26A...640A...1C/abstract',
-                                     data_url='https://cdsarc.cds.unistra.fr/ftp/J/A+A/640/A1/table1.dat')
-    p.status(f"{colors['GREEN']}Requesting data from {cantat_gaudin_study.show_study()}{colors['NC']}")
-    # Request data
-    response = requests.get(cantat_gaudin_study.data_url)
-    # Check the HTTP status code
-    if response.status_code == 200:
-        # Read the content of the response
-        source_code = response.text
-
-        # Split the source code into lines
-        lines = source_code.splitlines()
-
-        for line in lines:
-            columns = line.split()
-            # Special case
-            if "coin" in columns[0].lower():
-                possible_names = [columns[0].lower(), columns[0].lower().replace('-', ' ').replace('_', ' '),
-                                  columns[0].lower().replace('-', '').replace('_', '')]
-            # All the posible options
-            possible_names = [columns[0].lower(), columns[0].lower().replace('_', ' '),
-                              columns[0].lower().replace('_', ''), columns[0].lower().replace('_', '-')]
-
-            if args.name.lower() in possible_names:
-                columns = line.split()
-                name = columns[0].replace('_',' ')
-                ra = float(columns[1])
-                dec = float(columns[2])
-                r50 = float(columns[5])
-                n_stars = int(columns[6])
-                pmra = float(columns[7])
-                e_pmra = float(columns[8])
-                pmdec = float(columns[9])
-                e_pmdec = float(columns[10])
-                parallax = float(columns[11])
-                e_parallax = float(columns[12])
-                # Since some values in Cantat-Gaudin et al. study are filled with '---' values, if it that is the case
-                # fill them with -9999 (similar as was done for APOGEE survey)
-                try:
-                    log_age = float(columns[14])
-                    a_v = float(columns[15])
-                    d_modulus=float(columns[16])
-                    distance=float(columns[17])
-                    rgc=float(columns[-1])
-                except ValueError:
-                    if set_warning:
-                        print(f"{warning} {colors['RED']}Some parameters are not defined in {cantat_gaudin_study.show_study()}. Filling with '-9999' those values{colors['NC']}")
-                    log_age = -9999.
-                    a_v = -9999.
-                    d_modulus= -9999.
-                    distance= -9999.
-                    rgc= -9999.
-                cantat_object = onlineCantanObject(name=name,
-                                                   ra = ra,
-                                                   dec = dec,
-                                                   r50 = r50,
-                                                   n_stars=n_stars,
-                                                   pmra = pmra,
-                                                   e_pmra = e_pmra,
-                                                   pmdec = pmdec,
-                                                   e_pmdec = e_pmdec,
-                                                   parallax = parallax,
-                                                   e_parallax = e_parallax,
-                                                   log_age = log_age,
-                                                   a_v = a_v,
-                                                   d_modulus=d_modulus,
-                                                   distance=distance,
-                                                   rgc=rgc)
-
-                p.success(f"{colors['GREEN']}Data found as {colors['RED']}Open Cluster{colors['GREEN']} from {colors['PURPLE']}{cantat_gaudin_study.show_study()} {colors['NC']}")
-                return True, cantat_object
-    if response.status_code != 200:
-        p.failure(f"{colors['RED']}Unable to reach the data source website ('{cantat_gaudin_study.data_url}'). Check your internet connection and retry.{colors['NC']}")
-        time.sleep(2)
+    study_reference = cantat_gaudin_study.show_study()
+    p.status(f"{GREEN}Requesting data from {study_reference}{NC}")
+    # Check if the catalog could be obtained
+    if load_cantat_gaudin_catalog_index() is None:
+        p.failure(f"{RED}Unable to reach the data source website ('{cantat_gaudin_study.data_url}'). Check your internet connection and retry.{NC}")
+        return False, None
+    cantat_object = find_cantat_gaudin_object(canonical_object_name(args.name))
+    if cantat_object is None:
+        p.failure(f" {RED}Could not find online data available for '{args.name}' object. Continuing...")
         return False, None
-    p.failure(f" {colors['RED']}Could not find online data available for '{args.name}' object. Continuing...")
-    return False, None
+    # Parameters not defined in the catalog are filled with '-9999'
+    if set_warning and cantat_object.log_age == -9999.:
+        print(f"{warning} {RED}Some parameters are not defined in {study_reference}. Filling with '-9999' those values{NC}")
+    p.success(f"{GREEN}Data found as {RED}Open Cluster{GREEN} from {PURPLE}{study_reference} {NC}")
+    return True, cantat_object
+
+
+# Units accepted for radius (--radius-units) and all the names they can be provided with
+radius_units = {name: unit for names, unit in ((('deg', 'degree', 'degs', 'degrees'), 'deg'),
+                                                (('arcmin', 'arcmins', 'arcminute', 'arcminutes'), 'arcmin'),
+                                                (('arcsec', 'arcsecs', 'arcsecond', 'arcseconds'), 'arcsec'))
+                for name in names}
 
 
 def decide_units_parameter(value, units):
     """
     Check if the radius provided by the user, along with its units, is valid
     """
+    import astropy.units as u
     # Check if the value provided by the user is valid
     if value < 0:
-        print("{warning} Radius must be a positive number. Check '-r' flag provided and retry")
+        print(f"{warning} Radius must be a positive number. Check '-r' flag provided and retry")
         sys.exit(1)
     # Check which unit should we use to make the request
-    unit = units.lower()
-    if unit == 'deg' or unit == 'degree' or unit == 'degs' or unit == 'degrees':
-        return u.deg
-    if unit  == 'arcmin' or unit  == 'arcmins' or unit  == 'arcminute' or unit == 'arcminutes':
-        return u.arcmin
-    if unit == 'arcsec' or unit == 'arcsecs' or unit == 'arcsecond' or unit == 'arcseconds':
-        return u.arcsec
-    print(f"{warning} {colors['RED']}You have provided an invalid value for radii (--radius-units='{units}'). Using default value: 'arcmin'{colors['NC']}")
+    unit = radius_units.get(units.lower())
+    if unit is not None:
+        return u.Unit(unit)
+    print(f"{warning} {RED}You have provided an invalid value for radii (--radius-units='{units}'). Using default value: 'arcmin'{NC}")
     return u.arcmin
 
 
@@ -1265,7 +1586,7 @@ def check_number_of_rows_provided(rows):
     """
     if rows == -1 or rows > 0:
         return
-    print(f"{warning} {colors['RED']}You have provided an invalid number of rows (--row-limit= {rows}). Value must be a positive integer or -1 ('NO LIMIT'){colors['NC']}")
+    print(f"{warning} {RED}You have provided an invalid number of rows (--row-limit= {rows}). Value must be a positive integer or -1 ('NO LIMIT'){NC}")
     sys.exit(1)
 
 
@@ -1274,6 +1595,7 @@ def print_elapsed_time(start_time, text_to_print)->None:
     Checks how much time a process has taken
     """
     elapsed_time = time.time() - start_time
+    # Pick a single random color for the text and the lines surrounding it
     color1 = randomColor()
 
     # If the time took more than a minute, print it in format MM m SS.S s
@@ -1282,21 +1604,23 @@ def print_elapsed_time(start_time, text_to_print)->None:
         minutes = int(elapsed_time // 60)
         seconds = elapsed_time % 60
         text_elapsed_time = f"Elapsed time {text_to_print}: {minutes}m {seconds:.1f}s"
-        len_text = len(text_elapsed_time) + 4
-        text_elapsed_time = f"{sb} {randomColor()}{text_elapsed_time}{colors['NC']}"
     # If the execution time is less than a minute, then print only in second format   
     else:
         text_elapsed_time = f"Elapsed time {text_to_print}: {elapsed_time:.1f}s"
-        len_text = len(text_elapsed_time) + 4 
-        text_elapsed_time = f"{sb} {randomColor()}{text_elapsed_time}{colors['NC']}"
+    len_text = len(text_elapsed_time) + 4
+    separator = f"{color1}{'-'*len_text}{NC}"
     print()
-    print(f"{color1}"+"-"*len_text+f"{colors['NC']}")
-    print(text_elapsed_time)
-    print(f"{color1}"+"-"*len_text+f"{colors['NC']}")
+    print(separator)
+    print(f"{sb} {color1}{text_elapsed_time}{NC}")
+    print(separator)
     return
 
 
-@dataclass(kw_only=True)
+# Types of objects that data can be identified as
+allowed_identified_as = frozenset(("GlobularCluster", "OpenCluster", "Other"))
+
+
+@dataclass(kw_only=True, slots=True)
 class objectInfo:
     name: str
     RA: float
@@ -1309,44 +1633,58 @@ class objectInfo:
         """
         Check which type of object has the data been identified as
         """
-        allowed_values = ["GlobularCluster", "OpenCluster", "Other"]
-        if self.identifiedAs not in allowed_values:
-            raise ValueError(f"Invalid identifiedAs value. Allowed values are: {allowed_values}")
+        if self.identifiedAs not in allowed_identified_as:
+            raise ValueError(f"Invalid identifiedAs value. Allowed values are: {sorted(allowed_identified_as)}")
+
+
+def get_object_info_not_found_online(args, fill=False, print_decide_coords=True) -> objectInfo:
+    """
+    Get the object info when it has not been searched/found online, so it is identified as "Other"
+    """
+    if not fill:
+        RA, DEC = decide_coords(args, print_process=print_decide_coords)
+    else: # fill the data with anything
+        RA, DEC = 0.0, 0.0
+    # Since the object was not found, fill the proper motion with some values
+    return objectInfo(name=args.name, RA=RA, DEC=DEC, pmra=0.0, pmdec=0.0, identifiedAs="Other")
+
+
+def load_catalog_indexes_concurrently() -> None:
+    """
+    Request and index Globular and Open Clusters catalogs at the same time, so their downloads overlap instead of
+    waiting one after the other. The indexes are kept by their loaders to be used later
+    """
+    catalog_loaders = (load_vasiliev_catalog_index, load_cantat_gaudin_catalog_index)
+    with ThreadPoolExecutor(max_workers=len(catalog_loaders)) as executor:
+        for catalog_loader in catalog_loaders:
+            executor.submit(catalog_loader)
 
 
 def get_RA_and_DEC(args, fill=False, print_decide_coords=True):
     """
     Get coordinates of the object in degrees
     """
-    object_online_found = False
+    # If the flag '--skip-extra-data' is provided, do not search Gaia-based data online
     if args.skip_extra_data:
         print(f"{sb} 'Skip extra data' enabled. Skipping online data extract steps...")
-    # if the flag '--skip-extra-data' is not provided, get Gaia-based data online
-    if not args.skip_extra_data:
-        p = log.progress(f"{colors['L_GREEN']}Searching data online{colors['NC']}")
-        # Check is the object is found as a Globular cluster
-        object_online_found, object_online_data = get_extra_object_info_globular_cluster(args, p)
-        identified="GlobularCluster"
-        # If the object has not been found as a Globular Cluster, search if it is a Open Cluster
-        if not object_online_found:
-            object_online_found, object_online_data = get_extra_object_info_open_cluster(args, p)
-            identified = "OpenCluster"
-    # If the object was found online, use those coords. Otherwise search for coords using astropy and, lastly, the ones provided by the user
+        return get_object_info_not_found_online(args, fill, print_decide_coords)
+    p = progressLog(f"{L_GREEN}Searching data online{NC}")
+    # Download both catalogs at the same time, since the object could be in any of them
+    p.status(f"{GREEN}Requesting online catalogs...{NC}")
+    load_catalog_indexes_concurrently()
+    # Check is the object is found as a Globular cluster
+    object_online_found, object_online_data = get_extra_object_info_globular_cluster(args, p)
+    identified="GlobularCluster"
+    # If the object has not been found as a Globular Cluster, search if it is a Open Cluster
     if not object_online_found:
-        if not fill:
-            RA, DEC = decide_coords(args, print_process=print_decide_coords)
-            pmra, pmdec = 0.0, 0.0 # If the object was not found, fill the proper motion with some values
-            identified = "Other"
-        else: # fill the data with anything
-            RA, DEC = 0.0, 0.0
-            pmra, pmdec = 0.0, 0.0
-            identified = "Other"
-    else: # if object_online_found
-        RA, DEC = object_online_data.ra, object_online_data.dec
-        pmra, pmdec = object_online_data.pmra, object_online_data.pmdec
-    object_info = objectInfo(name=args.name, RA=RA, DEC=DEC, pmra=pmra, pmdec= pmdec, identifiedAs=identified)
-
-    return object_info
+        object_online_found, object_online_data = get_extra_object_info_open_cluster(args, p)
+        identified = "OpenCluster"
+    # If the object was not found online search for coords using astropy and, lastly, the ones provided by the user
+    if not object_online_found:
+        return get_object_info_not_found_online(args, fill, print_decide_coords)
+    # If the object was found online, use those coords
+    return objectInfo(name=args.name, RA=object_online_data.ra, DEC=object_online_data.dec,
+                      pmra=object_online_data.pmra, pmdec=object_online_data.pmdec, identifiedAs=identified)
 
 
 def print_data_requested(data, start_time, show_n_rows=13):
@@ -1359,39 +1697,39 @@ def print_data_requested(data, start_time, show_n_rows=13):
     print_elapsed_time(start_time, "requesting data")
 
 
+@functools.lru_cache(maxsize=1)
 def check_if_save_file_exists():
     """
     A file should be located/created as $HOME/.astrogaia-python/working.txt. 
     The content of this file should be where would you liketo save all the outputs 
     for this program. If the file is blank/empty then we use that path to save all 
-    the data
+    the data. The working directory does not change while running, so the result is cached
     """
-    # Get $HOME path for current user
-    home_dir = os.path.expanduser("~")
-    # Name of the file containing the absolute path for the working directory
-    working_dir_file = "working.txt"
     try:
-        with open(f"{home_dir}/.astrogaia-python/{working_dir_file}") as file:
-            # Read the first line, I do not care about the rest
-            working_directory = file.readline()
+        # The file only contains a path, so read it with a single unbuffered read
+        file_descriptor = os.open(working_dir_file_path, os.O_RDONLY)
     except FileNotFoundError:
         return False, ''
-    working_directory = working_directory.strip()
-    if working_directory.endswith('/'):
-        working_directory = working_directory.rstrip('/')
-    return True, working_directory
+    try:
+        content = os.read(file_descriptor, 4096)
+    finally:
+        os.close(file_descriptor)
+    # Keep the first line, I do not care about the rest
+    working_directory = content.decode('utf-8', 'replace').split('\n', 1)[0]
+    return True, working_directory.strip().rstrip('/')
 
 
 def check_if_directory_exists(pre_path: str, path_to_check: str, ask_user=False)->None:
     """
     Checks if a directory exists. If it does not exist, create it
     """
-    pre_path_var = str(pre_path)
     if not os.path.exists(path_to_check):
-        pure_path = path_to_check.replace(pre_path_var, '', 1).replace('/','',1)
-        print(f"{warning} Could not find '{pure_path}' directory in '{shortened_path(str(pre_path))}'. Creating it...")
+        # 'path_to_check' is built joining 'pre_path' and the new directory, so just remove that prefix
+        pure_path = path_to_check[len(pre_path):].lstrip('/')
+        short_pre_path = shortened_path(pre_path)
+        print(f"{warning} Could not find '{pure_path}' directory in '{short_pre_path}'. Creating it...")
         if ask_user:
-            ask_text = f"{sb_v2} {colors['GREEN']}Do you want to create '{pure_path}' directory in '{shortened_path(str(pre_path))}' path? {colors['RED']}[Y]es/[N]o{colors['NC']}: "
+            ask_text = f"{sb_v2} {GREEN}Do you want to create '{pure_path}' directory in '{short_pre_path}' path? {RED}[Y]es/[N]o{NC}: "
             wantToCreateDir = ask_to(ask_text)
             if wantToCreateDir:
                 os.makedirs(path_to_check)
@@ -1404,19 +1742,24 @@ def check_if_directory_exists(pre_path: str, path_to_check: str, ask_user=False)
     return
 
 
-def get_Object_directory(args, object_path, obj_name, objectIdentifiedAs):
+def get_Object_directory(args, object_path, object_name_to_save, objectIdentifiedAs):
+    """
+    Get (and create if needed) the directory where data for an object will be saved.
+    'object_name_to_save' must be the object name already in lowercase and with '_' instead of spaces
+    """
     results_dir_name = 'Objects'
-    object_name_to_save = obj_name.lower().replace(' ','_')
-    object_dir_path = f"{object_path}/{results_dir_name}"
-    # Check if 'Objects' directory exists. If not, create it
+    # Directory where data will be saved, i.e., 'Objects/<GlobularCluster, OpenCluster or Other>/<object name>'
+    # e.g., since NGC104 is a Globular Cluster, its directory is 'Objects/GlobularCluster/ngc104'
+    path_to_save = os.path.join(object_path, results_dir_name, objectIdentifiedAs, object_name_to_save)
+    # Usually the directory has already been created in a previous run, so there is nothing else to do
+    if os.path.isdir(path_to_save):
+        return path_to_save
+    # Check if 'Objects' directory exists. If not, create it (asking the user if required)
+    object_dir_path = os.path.join(object_path, results_dir_name)
     check_if_directory_exists(object_path, object_dir_path, ask_user=args.force_create_directory)
-    # Check if, inside 'Objects' directory, the directories "GlobularCluster", "OpenCluster" or "Other" exist
-    section_path = f"{object_dir_path}/{objectIdentifiedAs}"
-    check_if_directory_exists(object_dir_path, section_path)
-    # Finally, check if a directory with the object name exists within its respective type directory
-    # e.g., since NGC104 is a Globular Cluster, check if 'Object/GlobularCluster/ngc104' directory exists
-    path_to_save = f"{section_path}/{object_name_to_save}"
-    check_if_directory_exists(section_path, path_to_save)
+    # Create the object type and object name directories inside 'Objects' in a single call
+    print(f"{warning} Could not find '{path_to_save[len(object_dir_path):].lstrip('/')}' directory in '{shortened_path(object_dir_path)}'. Creating it...")
+    os.makedirs(path_to_save, exist_ok=True)
     return path_to_save
 
 
@@ -1424,10 +1767,11 @@ def shortened_path(full_path: str) -> str:
     """
     Shorten a path if it is too large to print a shorter string
     """
-    # Split the path into "/"
-    list_path = full_path.split('/')
-    # Delete elements that are 'null'/empty strings
-    list_path = [element for element in list_path if element]
+    # With 3 or fewer '/' the path cannot have more than 4 components, so there is nothing to shorten
+    if full_path.count('/') <= 3:
+        return full_path
+    # Split the path into "/", ignoring leading and trailing separators
+    list_path = full_path.strip('/').split('/')
     if len(list_path) <= 4:
         return full_path
     i=0
@@ -1437,48 +1781,54 @@ def shortened_path(full_path: str) -> str:
     return short_path
     
 
+@functools.lru_cache(maxsize=1)
+def get_current_working_directory() -> str:
+    """
+    Get the current working directory. The program never changes it, so it is requested only once
+    """
+    return os.getcwd()
+
+
 def where_to_save_data_if_found_in_Archive(args, command, mode, p, object_info)->str:
-    if not args.outfile:
+    outfile = args.outfile
+    if not outfile:
         working_dir_file_exists, working_dir = check_if_save_file_exists()
         if working_dir_file_exists:
             current_path = working_dir
             print("File exists")
         else:
-            current_path = Path.cwd()
-        object_path_to_save = get_Object_directory(args, current_path, object_info.name, object_info.identifiedAs)
-        filename = f"{object_info.name.replace(' ', '_').lower()}_{command}_{mode}.dat"
-        filename = f"{object_path_to_save}/{filename}"
-        p.status(f"{colors['YELLOW']}No outfile name provided in input. {colors['GREEN']}Data will be saved as\n'{colors['L_BLUE']}{filename}{colors['GREEN']}'\ninto working directory ('{shortened_path(str(current_path))}'){colors['NC']}{colors['NC']}")
+            current_path = get_current_working_directory()
+        # Lowercase object name without spaces, used for both the directory and the filename
+        object_name_to_save = object_info.name.lower().replace(' ', '_')
+        object_path_to_save = get_Object_directory(args, current_path, object_name_to_save, object_info.identifiedAs)
+        filename = f"{object_name_to_save}_{command}_{mode}.dat"
+        filename = os.path.join(object_path_to_save, filename)
+        p.status(no_outfile_provided_msg.format(filename=filename, short_path=shortened_path(current_path)))
         return filename
-    if args.outfile:
-        possible_extensions = ['.dat', '.csv', '.txt']
-        endsWithValidFileExtension = False
-        for fileExtension in possible_extensions:
-            if args.outfile.endswith(fileExtension):
-                endsWithValidFileExtension = True
-                break
-        if endsWithValidFileExtension:
-            filename = str(args.outfile)
-        else:
-            filename = f"{args.outfile}.dat"
-        # Convert to a Path object
-        path = Path(filename)
-        current_path = Path.cwd()
-        if path.is_absolute():
-            p.status(f"{colors['GREEN']}Saving {command!r} data in '{filename}'")
-        else:
-            p.status(f"{colors['GREEN']}Saving data in '{filename}' file into current directory ('{current_path}')...")
+    possible_extensions = ('.dat', '.csv', '.txt')
+    # 'str.endswith' accepts a tuple, so all the extensions are checked in a single call
+    if outfile.endswith(possible_extensions):
+        filename = outfile
+    else:
+        filename = f"{outfile}.dat"
+    if os.path.isabs(filename):
+        p.status(saving_absolute_path_msg.format(command=command, filename=filename))
+    else:
+        p.status(saving_current_dir_msg.format(filename=filename, current_path=get_current_working_directory()))
     return filename
 
 
+# Regular expression patterns for replies to 'Yes/No' and 'Change/Keep' prompts
+yes_pattern = re.compile(r"^(y|ye|yes)$", re.IGNORECASE)
+no_pattern = re.compile(r"^(n|no)$", re.IGNORECASE)
+change_pattern = re.compile(r"^(c|ch|cha|chan|chang|change)$", re.IGNORECASE)
+keep_pattern = re.compile(r"^(k|ke|kee|keep)$", re.IGNORECASE)
+
+
 def ask_to(ask_text: str, max_attempts=10)->bool | None:
     """
     Asks the user with a prompt and receives a 'Yes/No' reply. Yes = True, No = False
     """
-    # Regular expression patterns
-    yes_pattern = re.compile(r"^(y|ye|yes)$", re.IGNORECASE)
-    no_pattern = re.compile(r"^(n|no)$", re.IGNORECASE)
-
     # Initalize attempts
     attempts = 0
 
@@ -1490,28 +1840,28 @@ def ask_to(ask_text: str, max_attempts=10)->bool | None:
         elif no_pattern.match(response):
             return False
         else:
-            print(f"{warning} {colors['YELLOW']}Invalid option. Please enter '[{colors['L_RED']}Y{colors['YELLOW']}]es' or '[{colors['L_RED']}N{colors['YELLOW']}]o'{colors['NC']}")
+            print(f"{warning} {YELLOW}Invalid option. Please enter '[{L_RED}Y{YELLOW}]es' or '[{L_RED}N{YELLOW}]o'{NC}")
             print(f"    Remaining attempts: {max_attempts - attempts}")
             attempts += 1
 
     if attempts > max_attempts:
-        print(f"{warning} {colors['L_RED']}You have reached the maximum number of attempts. Exiting...{colors['NC']}")
+        print(f"{warning} {L_RED}You have reached the maximum number of attempts. Exiting...{NC}")
         sys.exit(1)
 
 
 def print_before_and_after_filter_length(original_length: int, filtered_length: int, n_prints=70)->None:
     # Get the user's terminal width and compute its half size
-    terminal_width = shutil.get_terminal_size().columns
+    terminal_width = get_terminal_width()
     total_width = terminal_width // 2
     # Pick some random chars and colors to print
     pick_color = randomColor()
     random_char = randomChar()
-    separator = f"{pick_color}{random_char*total_width}{colors['NC']}"
+    separator = f"{pick_color}{random_char*total_width}{NC}"
     print()
     print(separator)
-    print(f"  {colors['BROWN']}-> {colors['RED']}Original data size: {colors['PURPLE']}{original_length}{colors['NC']}")
-    print(f"  {colors['BROWN']}-> {colors['GREEN']}Filtered data size: {colors['BLUE']}{filtered_length}{colors['NC']}")
-    print(f"  {colors['BROWN']}-> {colors['L_GREEN']}\"Survival\" data:    {colors['L_BLUE']}{((filtered_length/original_length)*100):.2f}%{colors['NC']}")
+    print(f"  {BROWN}-> {RED}Original data size: {PURPLE}{original_length}{NC}")
+    print(f"  {BROWN}-> {GREEN}Filtered data size: {BLUE}{filtered_length}{NC}")
+    print(f"  {BROWN}-> {L_GREEN}\"Survival\" data:    {L_BLUE}{((filtered_length/original_length)*100):.2f}%{NC}")
     print(separator)
     print()
     return None
@@ -1574,26 +1924,25 @@ def decide_parameters_to_save_data(args, object_info: objectInfo | None):
 
 
 def save_data_output(args, command, mode, object_info, data):
-    p = log.progress(f"{colors['L_GREEN']}Saving data{colors['NC']}")
+    p = progressLog(saving_data_title)
     filename = where_to_save_data_if_found_in_Archive(args, command, mode, p, object_info)
+    data_format = args.data_outfile_format
     # If the user explicitly wants to replace the file, skip the step checking this
     if not args.force_overwrite_outfile:
-        file_path = Path(filename)
         # Check if file exists
-        if file_path.exists():
-            print(f"{warning} {colors['GREEN']}Output file already exists ('{shortened_path(filename)}'){colors['NC']}")
-            ask_text = f"{sb_v2} {colors['GREEN']}Do you want to replace the file? {colors['RED']}[Y]es/[N]o{colors['NC']}: "           
-            replace_file = ask_to(ask_text)
+        if os.path.exists(filename):
+            print(outfile_exists_msg.format(short_path=shortened_path(filename)))
+            replace_file = ask_to(ask_replace_file_msg)
             if not replace_file:
-                p.failure(f"{colors['RED']}Not replacing file. Exiting...{colors['NC']}")
+                p.failure(not_replacing_file_msg)
                 sys.exit(1)
             if replace_file:
-                print(f"{sb} {colors['GREEN']}Saving file as '{shortened_path(filename)}' with '{args.data_outfile_format}' data format...{colors['NC']}")
-                data.write(filename, format=args.data_outfile_format, overwrite=True)
-                p.success(f"{colors['L_GREEN']}Data saved{colors['NC']}")
+                print(saving_file_as_msg.format(short_path=shortened_path(filename), data_format=data_format))
+                data.write(filename, format=data_format, overwrite=True)
+                p.success(data_replaced_msg)
                 return
-    data.write(filename, format=args.data_outfile_format, overwrite=True)
-    p.success(f"{colors['GREEN']}Data saved{colors['NC']}")
+    data.write(filename, format=data_format, overwrite=True)
+    p.success(data_saved_msg)
 
 
 @dataclass(kw_only=True)
@@ -1610,7 +1959,7 @@ def get_pmra_pmdec_for_VPD(args, obj_name, original_data:Table | None = None, us
     pmra and pmdec must be explicitly be given by the user. Otherwise quits the program
     """
     if args.pmra is None or args.pmdec is None:   
-        print(f"{sb} {colors['PURPLE']}No PMRA and/or PMDEC provided. Attempting to get these parameters based on object name in Archive...{colors['NC']}")
+        print(f"{sb} {PURPLE}No PMRA and/or PMDEC provided. Attempting to get these parameters based on object name in Archive...{NC}")
         # Manually add the object_name found to 'args' variable
         setattr(args, 'name', obj_name)
         setattr(args, 'skip_extra_data', False)
@@ -1620,28 +1969,28 @@ def get_pmra_pmdec_for_VPD(args, obj_name, original_data:Table | None = None, us
         # If they do, it means that the user has not provided arguments for '--pmra' or '--pmdec'
         # and the user will have to explicitly provide them since the program could not get them automatically
         if object_info.pmra == 0.0 and object_info.pmdec == 0.0 and object_info.identifiedAs == "Other":
-            print(f"{warning} {colors['RED']}Since you do not explicitly provided PMRA ('--pmra') and PMDEC ('--pmdec') parameters,\n    the program tried to automatically find them.{colors['NC']}")
-            print(f"{colors['RED']}    However, the program could not find any parameters for your object '{obj_name}' in Archive.{colors['NC']}")
-            print(f"{colors['RED']}    You will have to re-run the program providing '--pmra' and '--pmdec' parameters.{colors['NC']}")
+            print(f"{warning} {RED}Since you do not explicitly provided PMRA ('--pmra') and PMDEC ('--pmdec') parameters,\n    the program tried to automatically find them.{NC}")
+            print(f"{RED}    However, the program could not find any parameters for your object '{obj_name}' in Archive.{NC}")
+            print(f"{RED}    You will have to re-run the program providing '--pmra' and '--pmdec' parameters.{NC}")
             sys.exit(1)
         if object_info.identifiedAs == "GlobularCluster":
-            print(f"{sb} {colors['BLUE']}Object found in Archives. Using values from: {colors['PURPLE']}Vasiliev & Baumgardt (2021, MNRAS, 505, 5978V){colors['NC']}")
+            print(f"{sb} {BLUE}Object found in Archives. Using values from: {PURPLE}Vasiliev & Baumgardt (2021, MNRAS, 505, 5978V){NC}")
         if object_info.identifiedAs == "OpenCluster":
-            print(f"{sb} {colors['BLUE']}Object found in Archives. Using values from: {colors['PURPLE']}Cantat-Gaudin et al. (2020, A&A, 640, A1){colors['NC']}")
-        print(f"    {sb_v2} pmra:  {colors['CYAN']}{object_info.pmra} (mas/yr){colors['NC']}")
-        print(f"    {sb_v2} pmdec: {colors['CYAN']}{object_info.pmdec} (mas/yr){colors['NC']}")
+            print(f"{sb} {BLUE}Object found in Archives. Using values from: {PURPLE}Cantat-Gaudin et al. (2020, A&A, 640, A1){NC}")
+        print(f"    {sb_v2} pmra:  {CYAN}{object_info.pmra} (mas/yr){NC}")
+        print(f"    {sb_v2} pmdec: {CYAN}{object_info.pmdec} (mas/yr){NC}")
         pmra, pmdec = object_info.pmra, object_info.pmdec
         identified = object_info.identifiedAs
     else:
         if not useMedian:
-            print(f"    {sb_v2} pmra:  {colors['CYAN']}{args.pmra} (mas/yr){colors['NC']}")
-            print(f"    {sb_v2} pmdec: {colors['CYAN']}{args.pmdec} (mas/yr){colors['NC']}")
+            print(f"    {sb_v2} pmra:  {CYAN}{args.pmra} (mas/yr){NC}")
+            print(f"    {sb_v2} pmdec: {CYAN}{args.pmdec} (mas/yr){NC}")
             pmra, pmdec = args.pmra, args.pmdec
         else:
-            print(f"{sb} {colors['BLUE']}Using median values obtained from data for 'pmra' and 'pmdec'{colors['NC']}")
+            print(f"{sb} {BLUE}Using median values obtained from data for 'pmra' and 'pmdec'{NC}")
             pmra, pmdec = round(np.median(original_data['pmra']),3), round(np.median(original_data['pmdec']),3)
-            print(f"    {sb_v2} pmra:  {colors['CYAN']}{pmra} (mas/yr){colors['NC']}")
-            print(f"    {sb_v2} pmdec:  {colors['CYAN']}{pmdec} (mas/yr){colors['NC']}")
+            print(f"    {sb_v2} pmra:  {CYAN}{pmra} (mas/yr){NC}")
+            print(f"    {sb_v2} pmdec:  {CYAN}{pmdec} (mas/yr){NC}")
         identified = "Other"
     ellipseCenter = ellipseVPDCenter(pmra=pmra, pmdec=pmdec)
     return ellipseCenter, identified
@@ -1655,36 +2004,36 @@ def check_width_and_height_provided_for_ellipse(args, max_allowed: int =2)->None
     so the first item is the minimum and the second is the maximum
     """
     if len(args.width) != max_allowed:
-        print(f"{warning} {colors['RED']}You have provided an invalid number of parameters for ellipse width ('--width').{colors['NC']}")
-        print(f"{colors['RED']}    Maximum allowed number of parameters are {max_allowed}. However, you have provided {len(args.width)} params{colors['NC']}")
-        print(f"{colors['PURPLE']}    Example usage: --width 5.5 10.5{colors['NC']}")
+        print(f"{warning} {RED}You have provided an invalid number of parameters for ellipse width ('--width').{NC}")
+        print(f"{RED}    Maximum allowed number of parameters are {max_allowed}. However, you have provided {len(args.width)} params{NC}")
+        print(f"{PURPLE}    Example usage: --width 5.5 10.5{NC}")
         sys.exit(1)
     if len(args.height) != max_allowed:
-        print(f"{warning} {colors['RED']}You have provided an invalid number of parameters for ellipse heigth ('--heigth').{colors['NC']}")
-        print(f"{colors['RED']}    Maximum allowed number of parameters are {max_allowed}. However, you have provided {len(args.width)} params{colors['NC']}")
-        print(f"{colors['PURPLE']}    Example usage: --heigth 5.5 10.5{colors['NC']}")
+        print(f"{warning} {RED}You have provided an invalid number of parameters for ellipse heigth ('--heigth').{NC}")
+        print(f"{RED}    Maximum allowed number of parameters are {max_allowed}. However, you have provided {len(args.width)} params{NC}")
+        print(f"{PURPLE}    Example usage: --heigth 5.5 10.5{NC}")
         sys.exit(1)
     if len(args.inclination) != max_allowed:
-        print(f"{warning} {colors['RED']}You have provided an invalid number of parameters for ellipse inclination ('--inclination').{colors['NC']}")
-        print(f"{colors['RED']}    Maximum allowed number of parameters are {max_allowed}. However, you have provided {len(args.width)} params{colors['NC']}")
-        print(f"{colors['PURPLE']}    Example usage: --inclination -89.9 89.9{colors['NC']}")
+        print(f"{warning} {RED}You have provided an invalid number of parameters for ellipse inclination ('--inclination').{NC}")
+        print(f"{RED}    Maximum allowed number of parameters are {max_allowed}. However, you have provided {len(args.width)} params{NC}")
+        print(f"{PURPLE}    Example usage: --inclination -89.9 89.9{NC}")
         sys.exit(1)
     # Also check that the parameters are positive numbers
     # or inclination is a valid number, between -90 and 90
     for width in args.width:
         if width <= 0:
-            print(f"{warning} {colors['RED']}Widths provided must be positive{colors['NC']}")
-            print(f"{colors['RED']}    Invalid value: {width}{colors['NC']}")
+            print(f"{warning} {RED}Widths provided must be positive{NC}")
+            print(f"{RED}    Invalid value: {width}{NC}")
             sys.exit(1)
     for height in args.height:
         if height <= 0:
-            print(f"{warning} {colors['RED']}Heights provided must be positive{colors['NC']}")
-            print(f"{colors['RED']}    Invalid value: {height}{colors['NC']}")
+            print(f"{warning} {RED}Heights provided must be positive{NC}")
+            print(f"{RED}    Invalid value: {height}{NC}")
             sys.exit(1)
     for inclination in args.inclination:
         if not (-90.0 <= inclination <= 90.0):
-            print(f"{warning} {colors['RED']}Inlination must have a value between -90.0 and +90 (degrees){colors['NC']}")
-            print(f"{colors['RED']}    Invalid value: {inclination}{colors['NC']}")
+            print(f"{warning} {RED}Inlination must have a value between -90.0 and +90 (degrees){NC}")
+            print(f"{RED}    Invalid value: {inclination}{NC}")
             sys.exit(1)
     # Finally, order the lists
     args.width.sort()
@@ -1763,12 +2112,13 @@ def DefineEllipse(x: np.ndarray, y: np.ndarray, x_center: float, y_center: float
 def loop_Montecarlo(x: np.ndarray, y: np.ndarray,
                     w_array: np.ndarray, h_array: np.ndarray, a_array: np.ndarray,
                     pmra_center:float, pmdec_center:float, p) -> EllipseClass:
+    from tqdm import tqdm
     max_in_stars = 0
     total_length = len(w_array)*len(h_array)
-    p.status(f"{colors['GREEN']}Creating different ellipses and counting objects inside them ({colors['PURPLE']}{print_percentage(total_length, 0.0)}{colors['GREEN']}){colors['NC']}")
+    p.status(f"{GREEN}Creating different ellipses and counting objects inside them ({PURPLE}{print_percentage(total_length, 0.0)}{GREEN}){NC}")
     ellipse_parameters = EllipseClass(center_x=0., center_y=0, width=0., height=0., inclination=0.)
     counter_progress = 0
-    with tqdm(total=total_length, desc=f"{sb} {colors['BLUE']}Playing with ellipses{colors['NC']}", leave=False) as pbar:
+    with tqdm(total=total_length, desc=f"{sb} {BLUE}Playing with ellipses{NC}", leave=False) as pbar:
         for w_it in w_array:
             for h_it in h_array:
                 for angle_it in a_array:
@@ -1787,9 +2137,9 @@ def loop_Montecarlo(x: np.ndarray, y: np.ndarray,
                         ellipse_parameters = EllipseClass(center_x=pmra_center, center_y=pmdec_center, width=w_it,
                                                          height=h_it, inclination=angle_it)
                 counter_progress+=1
-                p.status(f"{colors['GREEN']}Creating different ellipses and counting objects inside them ({colors['PURPLE']}{print_percentage(total_length, counter_progress)}{colors['GREEN']}){colors['NC']}")
+                p.status(f"{GREEN}Creating different ellipses and counting objects inside them ({PURPLE}{print_percentage(total_length, counter_progress)}{GREEN}){NC}")
                 pbar.update(1)
-    p.success(f"{colors['PURPLE']}Optimal ellipse extracted{colors['NC']}")
+    p.success(f"{PURPLE}Optimal ellipse extracted{NC}")
     return ellipse_parameters
 
 
@@ -1816,7 +2166,7 @@ def count_stars_inside_ellipse(pmra_center: float , pmdec_center: float, origina
 
 
 def print_found_ellipse_attributes(ellipse: EllipseClass, ntimes=50)->None:
-    nc = colors['NC']
+    nc = NC
     c1= randomColor()
     c2= randomColor()
     c3 = randomColor()
@@ -1852,7 +2202,7 @@ def check_if_data_lies_inside_ellipse(original_data: Table, ell: EllipseClass):
             color_array.append('cyan') # Color to plot points outside ellipse
     
     if (len(x) != len(mask_array)) or (len(y) != len(mask_array)):
-        print(f"{warning}{colors['RED']}Ellipse mask length does not math the original data length{colors['NC']}")
+        print(f"{warning}{RED}Ellipse mask length does not math the original data length{NC}")
         sys.exit(1)
     mask_array = np.asarray(mask_array)
     return mask_array, color_array
@@ -1871,6 +2221,11 @@ def filter_data_by_mask(original_data: Table, mask_list):
 
 def plot_ellipse_in_VPD(args, obj_name: str, original_data: Table, ellipse: EllipseClass,
                         pmra_center: float, pmdec_center: float, colors_array):
+    # Imported here since it is slow to import and only needed when plotting
+    import matplotlib
+    import matplotlib.pyplot as plt
+    import matplotlib.patches as patches
+    from matplotlib.offsetbox import AnchoredText
     # Set the limits to plot
     x_limit = [pmra_center-5, pmra_center+5]
     y_limit = [pmdec_center-5, pmdec_center+5]
@@ -1928,11 +2283,8 @@ def set_new_values_for_ellipse_parameters(args, var_name: str, max_attempts=10):
     width, height and inclination recycling some variables previousle used; so it is no necessary to fully
     re-run the program
     """
-    ask_text = f"{sb} {colors['GREEN']} Do you want to Keep values or Change values for '{colors['RED']}{var_name}{colors['GREEN']}'?{colors['NC']}"
-    ask_text = f"{ask_text}\n    {colors['CYAN']}(C)hange value/(K)eep value: {colors['NC']}"
-    # Regular expression patterns
-    change_pattern = re.compile(r"^(c|ch|cha|chan|chang|change)$", re.IGNORECASE)
-    keep_pattern = re.compile(r"^(k|ke|kee|keep)$", re.IGNORECASE)
+    ask_text = f"{sb} {GREEN} Do you want to Keep values or Change values for '{RED}{var_name}{GREEN}'?{NC}"
+    ask_text = f"{ask_text}\n    {CYAN}(C)hange value/(K)eep value: {NC}"
     # Initalize attempts
     attempts = 0
 
@@ -1946,11 +2298,11 @@ def set_new_values_for_ellipse_parameters(args, var_name: str, max_attempts=10):
             wantToChange = False
             break
         else:
-            print(f"{warning} {colors['YELLOW']}Invalid option. Please enter '[{colors['L_RED']}C{colors['YELLOW']}]hange' or '[{colors['L_RED']}K{colors['YELLOW']}]eep'{colors['NC']}")
+            print(f"{warning} {YELLOW}Invalid option. Please enter '[{L_RED}C{YELLOW}]hange' or '[{L_RED}K{YELLOW}]eep'{NC}")
             print(f"    Remaining attempts: {max_attempts - attempts}")
             attempts += 1
         if attempts > max_attempts:
-            print(f"{warning} {colors['L_RED']}You have reached the maximum number of attempts. Exiting...{colors['NC']}")
+            print(f"{warning} {L_RED}You have reached the maximum number of attempts. Exiting...{NC}")
             sys.exit(1)
     if wantToChange:
         # Ask for minimum and maximum values
@@ -1978,7 +2330,7 @@ def set_new_values_for_ellipse_parameters(args, var_name: str, max_attempts=10):
         # Update the values
         setattr(args, var_name, value_list)
         setattr(args, n_step_label, updated_n_step)
-        print(f"{sb} {colors['GREEN']}Updated values for '{colors['PURPLE']}{var_name}{colors['GREEN']}' parameter")
+        print(f"{sb} {GREEN}Updated values for '{PURPLE}{var_name}{GREEN}' parameter")
     else:
         return
 
@@ -1995,9 +2347,9 @@ def filter_data_with_parameter(data, parameter, p, min_value=None, max_value=Non
             data = data[mask_filter]
             return data
         except KeyError:
-            print(f"{warning} {colors['RED']}You have provided an invalid parameter that could not be found in Gaia data: '{parameter}' {colors['NC']}")
-            print(f"    {colors['PURPLE']}Check columns with '{colors['BLUE']}{sys.argv[0]} show-gaia-content{colors['PURPLE']}' command to see available and valid parameters{colors['NC']}")
-            p.failure(f"{colors['RED']}Data could not be retrieved{colors['NC']}")
+            print(f"{warning} {RED}You have provided an invalid parameter that could not be found in Gaia data: '{parameter}' {NC}")
+            print(f"    {PURPLE}Check columns with '{BLUE}{sys.argv[0]} show-gaia-content{PURPLE}' command to see available and valid parameters{NC}")
+            p.failure(f"{RED}Data could not be retrieved{NC}")
             sys.exit(1)
     elif min_value is not None:
         try:
@@ -2005,9 +2357,9 @@ def filter_data_with_parameter(data, parameter, p, min_value=None, max_value=Non
             data = data[mask_filter]
             return data
         except KeyError:
-            print(f"{warning} {colors['RED']}You have provided an invalid parameter that could not be found in Gaia data: '{parameter}' {colors['NC']}")
-            print(f"    {colors['PURPLE']}Check columns with '{colors['BLUE']}{sys.argv[0]} show-gaia-content{colors['PURPLE']}' command to see available and valid parameters{colors['NC']}")
-            p.failure(f"{colors['RED']}Data could not be retrieved{colors['NC']}")
+            print(f"{warning} {RED}You have provided an invalid parameter that could not be found in Gaia data: '{parameter}' {NC}")
+            print(f"    {PURPLE}Check columns with '{BLUE}{sys.argv[0]} show-gaia-content{PURPLE}' command to see available and valid parameters{NC}")
+            p.failure(f"{RED}Data could not be retrieved{NC}")
             sys.exit(1)
     elif max_value is not None:
         try:
@@ -2015,29 +2367,29 @@ def filter_data_with_parameter(data, parameter, p, min_value=None, max_value=Non
             data = data[mask_filter]
             return data
         except KeyError:
-            print(f"{warning} {colors['RED']}You have provided an invalid parameter that could not be found in Gaia data: '{parameter}' {colors['NC']}")
-            print(f"    {colors['PURPLE']}Check columns with '{colors['BLUE']}{sys.argv[0]} show-gaia-content{colors['PURPLE']}' command to see available and valid parameters{colors['NC']}")
-            p.failure(f"{colors['RED']}Data could not be retrieved{colors['NC']}")
+            print(f"{warning} {RED}You have provided an invalid parameter that could not be found in Gaia data: '{parameter}' {NC}")
+            print(f"    {PURPLE}Check columns with '{BLUE}{sys.argv[0]} show-gaia-content{PURPLE}' command to see available and valid parameters{NC}")
+            p.failure(f"{RED}Data could not be retrieved{NC}")
             sys.exit(1)
     else:
-        print(f"{warning} {colors['RED']}No filters were applied{colors['NC']}")
+        print(f"{warning} {RED}No filters were applied{NC}")
         return data
   
 
 def apply_filter_to_data_with_parameters(args, data):
     original_data_length = len(data)
-    p = log.progress(f"{colors['L_GREEN']}Filtering data{colors['NC']}")
+    p = progressLog(f"{L_GREEN}Filtering data{NC}")
     # Make a deepcopy, so we do not modify the original data
     copy_original_data = copy.deepcopy(data)
     if not args.no_filter_ruwe:
-        print(f"    {colors['BROWN']}-> {colors['GREEN']}Filtering data by RUWE (smaller than {args.filter_by_ruwe})...{colors['NC']}")
+        print(f"    {BROWN}-> {GREEN}Filtering data by RUWE (smaller than {args.filter_by_ruwe})...{NC}")
         copy_original_data = filter_data_with_parameter(copy_original_data, 'ruwe', p, max_value=args.filter_by_ruwe)
     if not args.no_filter_pm_error:
-        print(f"    {colors['BROWN']}-> {colors['GREEN']}Filtering data by Proper Motion errors (smaller than {args.filter_by_pm_error} mas/yr)...{colors['NC']}")
+        print(f"    {BROWN}-> {GREEN}Filtering data by Proper Motion errors (smaller than {args.filter_by_pm_error} mas/yr)...{NC}")
         copy_original_data = filter_data_with_parameter(copy_original_data, 'pmra_error', p, max_value=args.filter_by_pm_error)
         copy_original_data = filter_data_with_parameter(copy_original_data, 'pmdec_error', p, max_value=args.filter_by_pm_error)
     if not args.no_filter_g_rp:
-        print(f"    {colors['BROWN']}-> {colors['GREEN']}Filtering data by G_RP magnitude ({args.filter_by_g_rp_min} < G_RP/mag < {args.filter_by_g_rp_max})...{colors['NC']}")
+        print(f"    {BROWN}-> {GREEN}Filtering data by G_RP magnitude ({args.filter_by_g_rp_min} < G_RP/mag < {args.filter_by_g_rp_max})...{NC}")
         copy_original_data = filter_data_with_parameter(copy_original_data, 'phot_rp_mean_mag', p, 
                                                         max_value=args.filter_by_g_rp_max, 
                                                         min_value=args.filter_by_g_rp_min)
@@ -2049,6 +2401,7 @@ def get_data_from_file_or_query(args, subcommand, subsubcommand, showBanner=True
     """
     Check if the user has provided a filename containing data. If not, the data is provided querying data to Gaia Archive
     """
+    from astropy.table import Table
     # Display a banner
     if showBanner:
         displaySections(f'extract -- {subcommand} -- {subsubcommand}', randomColor(), randomChar())
@@ -2058,19 +2411,19 @@ def get_data_from_file_or_query(args, subcommand, subsubcommand, showBanner=True
     if isFileProvided:
         # Check if the filename the user provided exists
         check_if_read_file_exists(args.file)
-        p = log.progress(f"{colors['L_GREEN']}Data{colors['NC']}")
-        p.status(f"{colors['PURPLE']}Reading data file '{shortened_path(args.file)}'...{colors['NC']}")
+        p = progressLog(f"{L_GREEN}Data{NC}")
+        p.status(f"{PURPLE}Reading data file '{shortened_path(args.file)}'...{NC}")
         try:
             original_data = Table.read(args.file, format=args.file_format)   
         except Exception as e:
-            print(f"{warning} {colors['RED']}Unable to read '{args.file}' file with format '{args.file_format}'{colors['NC']}")
+            print(f"{warning} {RED}Unable to read '{args.file}' file with format '{args.file_format}'{NC}")
             print(f"Exception details: {e}")
-            p.failure(f"{colors['RED']}Could not retrieve data from file{colors['NC']}")
+            p.failure(f"{RED}Could not retrieve data from file{NC}")
             sys.exit(1)
-        p.success(f"{colors['GREEN']}Succesfully obtained data from file{colors['NC']}")
+        p.success(f"{GREEN}Succesfully obtained data from file{NC}")
         return original_data, None
     else:
-        checkNameObjectProvidedByUser(args.name)
+        args.name = checkNameObjectProvidedByUser(args.name)
         original_data, object_info = extractRawData(args, 'filter', 'cone', enableSave=False, showBanner=False)
         return original_data, object_info
 
@@ -2081,7 +2434,7 @@ def check_if_read_file_exists(filename)->None:
     """
     read_file_path = Path(filename)
     if not read_file_path.exists():
-        print(f"{warning} {colors['RED']}The filename you provided ('{colors['PURPLE']}{filename}{colors['RED']}') does not exist. Maybe you mispelled it?{colors['NC']}")
+        print(f"{warning} {RED}The filename you provided ('{PURPLE}{filename}{RED}') does not exist. Maybe you mispelled it?{NC}")
         sys.exit(1)
     return
 
@@ -2264,8 +2617,8 @@ def get_mag_filter_name(filter_name: str) -> str | None:
     elif mag_filter == 'g':
         return "G"
     else:
-        print(f"{warning} {colors['RED']}You have provided an invalid Gaia filter: '{filter_name}'{colors['NC']}")
-        print(f"{colors['RED']}    Valid filters are: 'g_rp', 'g_bp' or 'g' (in capital letters are also valid).\n    Please retry{colors['NC']}")
+        print(f"{warning} {RED}You have provided an invalid Gaia filter: '{filter_name}'{NC}")
+        print(f"{RED}    Valid filters are: 'g_rp', 'g_bp' or 'g' (in capital letters are also valid).\n    Please retry{NC}")
         sys.exit(1)
 
 
@@ -2276,11 +2629,12 @@ def print_values_bins(maxValue: float, minValue: float, nBins: int,
     A simple print statement to check values obtained from
     getBinSize function.
     """
+    from tabulate import tabulate
     # Pick a random color to print later
     rand_number = random.randint(31,36) 
-    c = f'\033[1;{rand_number}m' # color
-    sh = f'\033[{rand_number}m' # shadow
-    nc = colors['NC'] # no color / reset color
+    c = ansi_color(f'1;{rand_number}') # color
+    sh = ansi_color(f'{rand_number}') # shadow
+    nc = NC # no color / reset color
     filter_name = get_mag_filter_name(mag_filter_name)
 
     if print_more_details:
@@ -2290,15 +2644,15 @@ def print_values_bins(maxValue: float, minValue: float, nBins: int,
         text: str = "Estimated values are: "
         for j in range(1, 5):
             if j == 1:
-                print(f"{text}{j}) Max Value {filter_name} (mag): {maxValue:.3f} {colors['GRAY']}# Maximum value for G_RP magnitude{colors['NC']}")
+                print(f"{text}{j}) Max Value {filter_name} (mag): {maxValue:.3f} {GRAY}# Maximum value for G_RP magnitude{NC}")
             if j != 1:
                 print(len(text)*" " + f"{j}) ", end='')
                 if j == 2:
-                    print(f"Min Value {filter_name} (mag): {minValue:.3f} {colors['GRAY']}# Minimum value for {filter_name} magnitude{colors['NC']}")
+                    print(f"Min Value {filter_name} (mag): {minValue:.3f} {GRAY}# Minimum value for {filter_name} magnitude{NC}")
                 if j == 3:
-                    print(f"Number of req. Bins: {nBins} {colors['GRAY']}# Number of requested Bins{colors['NC']}")
+                    print(f"Number of req. Bins: {nBins} {GRAY}# Number of requested Bins{NC}")
                 if j == 4:
-                    print(f"Bin length {filter_name} (mag): {binValue:.3f} {colors['GRAY']}# Value of size/range for every bin{colors['NC']}")
+                    print(f"Bin length {filter_name} (mag): {binValue:.3f} {GRAY}# Value of size/range for every bin{NC}")
         print(len_marker*"=", end="\n")
 
     # Create a table that will store data to print
@@ -2318,7 +2672,7 @@ def print_values_bins(maxValue: float, minValue: float, nBins: int,
             data_median_mag_stddev: float = data.std_dev_G
             len_data_mag = len(data.params.G)
         else:
-            print(f"{warning}{colors['RED']}Invalid filter name: {filter_name}. Exiting...{colors['NC']}")
+            print(f"{warning}{RED}Invalid filter name: {filter_name}. Exiting...{NC}")
             sys.exit(1)
         temp_list = []
         temp_list.append(f"{sh}{data.ID}{nc}")
@@ -2351,16 +2705,16 @@ def check_if_total_bins_has_at_least_2_elems_or_more(totalBins: TotalBins, filte
         elif filter_name == "G":
             params_data_median_mag: float = bin_it.params.G
         else:
-            print(f"{warning}{colors['RED']}Invalid filter name: {filter_name}. Exiting...{colors['NC']}")
+            print(f"{warning}{RED}Invalid filter name: {filter_name}. Exiting...{NC}")
             sys.exit(1)
         # Check the length of 2 parameters
         if len(bin_it.params.as_gof_al) < minimum_per_bin:
-            print(f"{warning}{colors['RED']} Bin #{index+1} has {len(bin_it.params.as_gof_al)} elements{colors['NC']}")
-            print(f"    {colors['RED']}At least 2 elements are required per bin")
+            print(f"{warning}{RED} Bin #{index+1} has {len(bin_it.params.as_gof_al)} elements{NC}")
+            print(f"    {RED}At least 2 elements are required per bin")
             return False
         if len(params_data_median_mag) < minimum_per_bin:
-            print(f"{warning}{colors['RED']} Bin #{index+1} has {len(params_data_median_mag)} elements{colors['NC']}")
-            print(f"    {colors['RED']}At least 2 elements are required per bin")
+            print(f"{warning}{RED} Bin #{index+1} has {len(params_data_median_mag)} elements{NC}")
+            print(f"    {RED}At least 2 elements are required per bin")
             return False
     return True
 
@@ -2373,7 +2727,7 @@ def select_gaia_filter_key_param(filter_name: str)-> str | None:
     elif filter_name == 'G':
         return 'phot_g_mean_mag'
     else:
-        print(f"{warning}{colors['RED']}You have provided an invalid Gaia filter name ('{filter_name}'). Exiting...{colors['NC']}")
+        print(f"{warning}{RED}You have provided an invalid Gaia filter name ('{filter_name}'). Exiting...{NC}")
         sys.exit(1)
     
 
@@ -2402,7 +2756,7 @@ def create_bins(args, astrodata: Table, nDivision: int, ellipse_center: ellipseV
     for j in range(0, nDivision):
         minMag_mag_bin: float = minVal + (binVal * j)
         maxMag_mag_bin: float = minVal + (binVal *(j+1))
-        p.status(f"{colors['PURPLE']} {j+1}/{nDivision} for '{mag_filter_name}' mag in range [{minMag_mag_bin:.3f}, {maxMag_mag_bin:.3f}]{colors['NC']}")
+        p.status(f"{PURPLE} {j+1}/{nDivision} for '{mag_filter_name}' mag in range [{minMag_mag_bin:.3f}, {maxMag_mag_bin:.3f}]{NC}")
         tempParamater = parameterList()
         tempPM_RA, tempPM_DEC = [], []
         for tempData in astrodata:
@@ -2435,12 +2789,12 @@ def get_and_check_created_bins(args, astrodata: Table, ellipse_center: ellipseVP
     has at least 2 or more elements
     """
     n_divisions_for_bins = copy.deepcopy(args.n_divisions)
-    p = log.progress(f"{colors['L_BLUE']}Creating Bins{colors['NC']}")
+    p = progressLog(f"{L_BLUE}Creating Bins{NC}")
     mag_filter_name = get_mag_filter_name(args.set_mag_filter)
     counter = 0
     while True:
         if counter > 0:
-            print(f"{colors['L_RED']}[-] {colors['RED']}Failed with {n_divisions_for_bins+1} bins. Attempting with {n_divisions_for_bins} bins...{colors['NC']}")
+            print(f"{L_RED}[-] {RED}Failed with {n_divisions_for_bins+1} bins. Attempting with {n_divisions_for_bins} bins...{NC}")
         totalCustomBins, maxVal, minVal, binVal = create_bins(args, astrodata=astrodata,
                                                           nDivision=n_divisions_for_bins, 
                                                           ellipse_center=ellipse_center,
@@ -2449,12 +2803,12 @@ def get_and_check_created_bins(args, astrodata: Table, ellipse_center: ellipseVP
                                                                                    mag_filter_name,
                                                                                    n_divisions_for_bins)
         if validElementsNumbInBins:
-            p.success(f"{colors['PURPLE']}Bins created{colors['NC']}")
+            p.success(f"{PURPLE}Bins created{NC}")
             break
         n_divisions_for_bins -= 1
         counter +=1
         if n_divisions_for_bins < 2:
-            p.failure(f"{colors['RED']}Was not possible to create bins{colors['NC']}")
+            p.failure(f"{RED}Was not possible to create bins{NC}")
             sys.exit(1)
     if not args.no_print_bins:
         print_values_bins(maxVal, minVal, n_divisions_for_bins, binVal, totalCustomBins, mag_filter_name)
@@ -2496,7 +2850,7 @@ def create_points_to_interpolate(args, totalBins: TotalBins, varToInterpolate: s
             data_median_mag: float = data.median_G
             data_median_mag_stddev: float = data.std_dev_G
         else:
-            print(f"{warning}{colors['RED']}Invalid filter name: {filter_name}. Exiting...{colors['NC']}")
+            print(f"{warning}{RED}Invalid filter name: {filter_name}. Exiting...{NC}")
             sys.exit(1)
         if varToInterpolate == "as_gof_al" or varToInterpolate == "astrometric_gof_al":
             temp_median_var = data.median_as_gof_al
@@ -2521,7 +2875,7 @@ def create_points_to_interpolate(args, totalBins: TotalBins, varToInterpolate: s
 
     # Check that both list have the same size at this point
     if not len(totalBins.bins) == len(points.points):
-        print(f"{warning}{colors['RED']}Bins list and point list must have the same size!{colors['NC']}")
+        print(f"{warning}{RED}Bins list and point list must have the same size!{NC}")
         sys.exit() 
     
     for index in range(0, len(points.points)-1):
@@ -2548,7 +2902,7 @@ def create_points_to_interpolate(args, totalBins: TotalBins, varToInterpolate: s
         min_value_mag: float = np.amin(totalBins.bins[0].params.G)
         max_value_mag: float = np.amax(totalBins.bins[-1].params.G)
     else:
-        print(f"{warning}{colors['RED']}Invalid filter name: {filter_name}. Exiting...{colors['NC']}")
+        print(f"{warning}{RED}Invalid filter name: {filter_name}. Exiting...{NC}")
         sys.exit(1)
     points.points.insert(0,singlePoint(ID=0, median_value=firstPoint.median_value,
                          std_value= firstPoint.std_value,
@@ -2594,7 +2948,7 @@ def interpolate_data_var(args, usefulData: parameterList, data_to_interpolate:Ta
     elif filter_name == "G":
         useful_mag = usefulData.G
     else:
-        print(f"{warning} {colors['RED']}Invalid 'filter_name' in 'interpolate_data_var' (value given: '{filter_name}'){colors['NC']}")
+        print(f"{warning} {RED}Invalid 'filter_name' in 'interpolate_data_var' (value given: '{filter_name}'){NC}")
         sys.exit(1)
 
     for j in range(0, len(useful_mag)):
@@ -2640,9 +2994,9 @@ def interpolate_data_var(args, usefulData: parameterList, data_to_interpolate:Ta
             
     checkLengths = len(mask_array) == len(data_to_interpolate[gaia_key_mag])
     if not checkLengths:
-        print(f"{warning} {colors['RED']}Mask length and data length are not equal!{colors['NC']}")
-        print(f"    {colors['RED']}Mask length: {len(mask_array)}{colors['NC']}")
-        print(f"    {colors['RED']}{len(data_to_interpolate[gaia_key_mag])}{colors['NC']}")
+        print(f"{warning} {RED}Mask length and data length are not equal!{NC}")
+        print(f"    {RED}Mask length: {len(mask_array)}{NC}")
+        print(f"    {RED}{len(data_to_interpolate[gaia_key_mag])}{NC}")
         sys.exit(1)
     return  np.asarray(mask_array)
 
@@ -2672,7 +3026,7 @@ def do_and_print_interpolation(args, totalBins: TotalBins, preData: Table, len_o
         var_to_print = "as_gof_al"
     if varToInterpolate.lower() == "parallax":
         var_to_print = "parallax"
-    print(f"{sb} {colors['PURPLE']}Interpolating '{var_to_print}' parameter for a value of {sigma} σ...{colors['NC']}")
+    print(f"{sb} {PURPLE}Interpolating '{var_to_print}' parameter for a value of {sigma} σ...{NC}")
     if varToInterpolate != "parallax":
         data_filtered_by_param, points_separating_param = do_interpolation(args, totalBins=totalBins,
                                                                           dataToFilter=preData,
@@ -2685,10 +3039,10 @@ def do_and_print_interpolation(args, totalBins: TotalBins, preData: Table, len_o
                                                                              varToInterpolate=varToInterpolate,    
                                                                              sigma=sigma,
                                                                              ellipse_center=ellipse_center)
-    print(f"    {colors['BROWN']}-> {colors['CYAN']}Data size before filtering: {len_originalData}{colors['NC']}")
-    print(f"    {colors['BROWN']}-> {colors['GREEN']}Data size after filtering: {len(data_filtered_by_param)}{colors['NC']}")
-    print(f"    {colors['BROWN']}-> {colors['RED']}Data discarded:", end = " ")
-    print(f"{round(((len_originalData-len(data_filtered_by_param))/(1.0*len_originalData))*100,2)}%{colors['NC']}")
+    print(f"    {BROWN}-> {CYAN}Data size before filtering: {len_originalData}{NC}")
+    print(f"    {BROWN}-> {GREEN}Data size after filtering: {len(data_filtered_by_param)}{NC}")
+    print(f"    {BROWN}-> {RED}Data discarded:", end = " ")
+    print(f"{round(((len_originalData-len(data_filtered_by_param))/(1.0*len_originalData))*100,2)}%{NC}")
     if varToInterpolate != 'parallax':
         return data_filtered_by_param, points_separating_param
     else: 
@@ -2718,6 +3072,10 @@ def plot_interpolation(args, object_name: str, filtered_data: Table, original_da
     """
     Plot the data interpolated and filtered using Cordoni (2018) algorithm
     """
+    # Imported here since it is slow to import and only needed when plotting
+    import matplotlib
+    import matplotlib.pyplot as plt
+    from matplotlib.offsetbox import AnchoredText
     # Create some lists that will store the data (so we do not touch the original one)
     filter_name = get_mag_filter_name(args.set_mag_filter)
     gaia_key_mag = select_gaia_filter_key_param(filter_name)
@@ -2840,16 +3198,16 @@ def get_pmra_based_on_object_identification(args, obj_name, original_data:Table
     # If they do, it means that the user has not provided arguments for '--pmra' or '--pmdec'
     # and the user will have to explicitly provide them since the program could not get them automatically
     if object_info.identifiedAs == "GlobularCluster":
-        print(f"{sb} {colors['BLUE']}Object found in Archives. Using values from: {colors['PURPLE']}Vasiliev & Baumgardt (2021, MNRAS, 505, 5978V){colors['NC']}")
+        print(f"{sb} {BLUE}Object found in Archives. Using values from: {PURPLE}Vasiliev & Baumgardt (2021, MNRAS, 505, 5978V){NC}")
         pmra, pmdec = object_info.pmra, object_info.pmdec
     if object_info.identifiedAs == "OpenCluster":
-        print(f"{sb} {colors['BLUE']}Object found in Archives. Using values from: {colors['PURPLE']}Cantat-Gaudin et al. (2020, A&A, 640, A1){colors['NC']}")
+        print(f"{sb} {BLUE}Object found in Archives. Using values from: {PURPLE}Cantat-Gaudin et al. (2020, A&A, 640, A1){NC}")
         pmra, pmdec = object_info.pmra, object_info.pmdec
     if object_info.identifiedAs == "Other":
-        print(f"{sb} {colors['BLUE']}Using median values obtained from data for 'pmra' and 'pmdec'{colors['NC']}")
+        print(f"{sb} {BLUE}Using median values obtained from data for 'pmra' and 'pmdec'{NC}")
         pmra, pmdec = round(np.median(original_data['pmra']),3), round(np.median(original_data['pmdec']),3)
-    print(f"    {sb_v2} pmra:  {colors['CYAN']}{pmra} (mas/yr){colors['NC']}")
-    print(f"    {sb_v2} pmdec: {colors['CYAN']}{pmdec} (mas/yr){colors['NC']}")
+    print(f"    {sb_v2} pmra:  {CYAN}{pmra} (mas/yr){NC}")
+    print(f"    {sb_v2} pmdec: {CYAN}{pmdec} (mas/yr){NC}")
     identified = object_info.identifiedAs
     ellipseCenter = ellipseVPDCenter(pmra=pmra, pmdec=pmdec)
     return ellipseCenter, identified
@@ -2858,30 +3216,31 @@ def get_pmra_based_on_object_identification(args, obj_name, original_data:Table
 def check_arguments_provided_for_Cordoni_algorithm(args)->None:
     # Check if the number of iterations provided by the user is valid.
     if args.n_iterations <= 0:
-        print(f"{warning} {colors['RED']} Invalid number of iterations given: {args.n_iterations}. Value must be a positive number...{colors['NC']}")
+        print(f"{warning} {RED} Invalid number of iterations given: {args.n_iterations}. Value must be a positive number...{NC}")
         sys.exit(1)
     # User cannot disable 3 filters applied by Cordoni algorithm. If so, exit the program...
     if args.no_as_gof_al and args.no_mu_R and args.no_parallax:
-        print(f"{warning} {colors['RED']} You do not want to apply any filter to data. Are you sure?{colors['NC']}")
-        print(f"    {colors['RED']} '--no-as-gof-al', '--no-mu-R' and '--no-parallax' simoutaneously enabled{colors['NC']}")
+        print(f"{warning} {RED} You do not want to apply any filter to data. Are you sure?{NC}")
+        print(f"    {RED} '--no-as-gof-al', '--no-mu-R' and '--no-parallax' simoutaneously enabled{NC}")
         sys.exit(1)
     # Check if the user is using custom limits
     if args.set_limits:
-        print(f"{sb_v2} {colors['GREEN']}Using custom mag limits: {colors['BLUE']}[{args.mag_lower_limit}, {args.mag_upper_limit}]{colors['NC']}")
+        print(f"{sb_v2} {GREEN}Using custom mag limits: {BLUE}[{args.mag_lower_limit}, {args.mag_upper_limit}]{NC}")
     # Lower limit cannot be a bigger upper limit
     if args.mag_lower_limit >= args.mag_upper_limit:
-        print(f"{warning}{colors['RED']} Lower limit magnitude ({args.mag_lower_limit}) must be bigger than upper limit magnitude ({args.mag_upper_limit})...{colors['NC']}")
+        print(f"{warning}{RED} Lower limit magnitude ({args.mag_lower_limit}) must be bigger than upper limit magnitude ({args.mag_upper_limit})...{NC}")
         sys.exit(1)
     # Check if the user wants to show all the plots but at the same time hide all of them:
     if args.show_all_plots and args.no_plot_mu_R and args.no_plot_as_gof_al and args.no_plot_parallax:
-        print(f"{warning} {colors['RED']}...so you want to show all the plots but at the same time hide all of them?{colors['NC']}")
-        print(f"    {colors['RED']} '--show-all-plots', '--no-plot-as-gof-al', '--no-plot-mu-R' and '--no-plot-parallax' simoutaneously enabled{colors['NC']}")
+        print(f"{warning} {RED}...so you want to show all the plots but at the same time hide all of them?{NC}")
+        print(f"    {RED} '--show-all-plots', '--no-plot-as-gof-al', '--no-plot-mu-R' and '--no-plot-parallax' simoutaneously enabled{NC}")
         sys.exit(1)
     return
 
 
 def Cordoni_algorithm(args, object_name: str, totalBins: TotalBins, original_data: Table, 
                       iteration_number: int, ellipse_center: ellipseVPDCenter):
+    import matplotlib.pyplot as plt
     # Create a deep copy of the original data
     data_filtered = copy.deepcopy(original_data)
     if not args.no_as_gof_al:
@@ -2967,9 +3326,9 @@ def extractCordoniData(args, subcommand, subsubcommand):
     # Recycle ellipse found (explained below)
     recycleCenterEllipse = False
     # Start applying Cordoni et al. (2018) algorithm to data over iterations
-    p = log.progress(f"{colors['PURPLE']}Data{colors['NC']}")
+    p = progressLog(f"{PURPLE}Data{NC}")
     for iterator in range(1, args.n_iterations+1):
-        p.status(f"{colors['GREEN']}Filtering data using {colors['RED']}Cordoni et al. (2018, ApJ, 869, 139C){colors['GREEN']} algorithm ({colors['PURPLE']}{iterator}/{args.n_iterations}{colors['GREEN']}){colors['NC']}")
+        p.status(f"{GREEN}Filtering data using {RED}Cordoni et al. (2018, ApJ, 869, 139C){GREEN} algorithm ({PURPLE}{iterator}/{args.n_iterations}{GREEN}){NC}")
         cordoni_text_to_show = f"Iteration #{iterator}"
         displaySections(cordoni_text_to_show, color_chosen=randomColor(), character='#', c=randomColor())
         if iterator == 1:
@@ -2985,24 +3344,24 @@ def extractCordoniData(args, subcommand, subsubcommand):
         # Re-compute the ellipse center if the data is found as "Other" or if the user wants to re-compute it...
         if (iterator != 1 and not recycleCenterEllipse) or args.re_compute_ellipse_center:
             if iterator != 1:
-                print(f"{sb} {colors['GREEN']}Re-computing ellipse center...{colors['NC']}")
-                print(f"    {sb_v2} {colors['CYAN']}Old Center Coords (pmra, pmdec) (mas/yr): {colors['RED']}({centerEllipse.pmra}, {centerEllipse.pmdec}){colors['NC']}")
+                print(f"{sb} {GREEN}Re-computing ellipse center...{NC}")
+                print(f"    {sb_v2} {CYAN}Old Center Coords (pmra, pmdec) (mas/yr): {RED}({centerEllipse.pmra}, {centerEllipse.pmdec}){NC}")
             centerEllipse = get_median_pmra_pmdec(data_to_work)
             if iterator != 1:
-                print(f"    {sb_v2} {colors['CYAN']}New Center Coords (pmra, pmdec) (mas/yr): {colors['PURPLE']}({centerEllipse.pmra}, {centerEllipse.pmdec}){colors['NC']}")
+                print(f"    {sb_v2} {CYAN}New Center Coords (pmra, pmdec) (mas/yr): {PURPLE}({centerEllipse.pmra}, {centerEllipse.pmdec}){NC}")
         totalCustomBins = get_and_check_created_bins(args, astrodata=data_to_work, ellipse_center=centerEllipse)
         filtered_data = Cordoni_algorithm(args, obj_name, totalCustomBins, data_to_work, iterator, centerEllipse)
-    p.success(f"{colors['CYAN']} Cordoni algorithm succesfully applied to data{colors['NC']}")
+    p.success(f"{CYAN} Cordoni algorithm succesfully applied to data{NC}")
     print_before_and_after_filter_length(len(original_data), len(filtered_data))
-    p = log.progress(f"{colors['PINK']}Saving data{colors['NC']}")
+    p = progressLog(f"{PINK}Saving data{NC}")
     # If the user provided a file, try to obtain the "identifiedAs" parameter based on its path
     object_info_identified = decide_parameters_to_save_data(args, object_info)
     # Save data if needed
     if not args.no_save_output:
         save_data_output(args, subcommand, subsubcommand, object_info_identified, filtered_data)
-        p.success(f"{colors['GREEN']}Data succesfully saved{colors['NC']}")
+        p.success(f"{GREEN}Data succesfully saved{NC}")
     else:
-        p.failure(f"{colors['RED']}Data has not been saved{colors['NC']}")
+        p.failure(f"{RED}Data has not been saved{NC}")
     return filtered_data
 
 
@@ -3024,7 +3383,7 @@ def extractEllipseData(args, subcommand, subsubcommand):
     while True:
         width_it, height_it, incl_it = create_IteratorClass_objects_for_ellipse(args)
         # Create a simple process to track the results
-        p = log.progress("Ellipse")
+        p = progressLog("Ellipse")
         # Get the "optimal ellipse", which maximizes the number of objects inside it
         ellipse = count_stars_inside_ellipse(centerEllipse.pmra, centerEllipse.pmdec, original_data, 
                                              width_it, height_it, incl_it, p)
@@ -3036,30 +3395,30 @@ def extractEllipseData(args, subcommand, subsubcommand):
         try:
             plot_ellipse_in_VPD(args, obj_name, original_data, ellipse, centerEllipse.pmra, 
                                 centerEllipse.pmdec, colors_array)
-        except:
-            print(f"{warning} {colors['RED']}Something happened when trying to plot VPD and ellipse. Continuing without plotting...{colors['NC']}")
+        except Exception:
+            print(f"{warning} {RED}Something happened when trying to plot VPD and ellipse. Continuing without plotting...{NC}")
             break
-        isUserHappy = ask_to(f"{colors['GREEN']}{sb} Are you happy with this result? {colors['RED']}[Y]es/[N]o{colors['GREEN']}: {colors['NC']}")
+        isUserHappy = ask_to(f"{GREEN}{sb} Are you happy with this result? {RED}[Y]es/[N]o{GREEN}: {NC}")
         if isUserHappy:
             break
         else:
-            wantToContinue = ask_to(f"{colors['RED']}{sb} Do you want to continue with the program? {colors['PURPLE']}[Y]es/[N]o{colors['RED']}: {colors['NC']}")
+            wantToContinue = ask_to(f"{RED}{sb} Do you want to continue with the program? {PURPLE}[Y]es/[N]o{RED}: {NC}")
             if not wantToContinue:
-                print(f"\n{colors['L_CYAN']}Bye!{colors['NC']}")
+                print(f"\n{L_CYAN}Bye!{NC}")
                 sys.exit(0)
             else:
                 set_new_values_for_ellipse_parameters(args, 'width')
                 set_new_values_for_ellipse_parameters(args, 'height')
                 set_new_values_for_ellipse_parameters(args, 'inclination')
-    p = log.progress(f"{colors['PINK']}Saving data{colors['NC']}")
+    p = progressLog(f"{PINK}Saving data{NC}")
     # If the user provided a file, try to obtain the "identifiedAs" parameter based on its path
     object_info_identified = decide_parameters_to_save_data(args, object_info)
     # Save data if needed
     if not args.no_save_output:
         save_data_output(args, subcommand, subsubcommand, object_info_identified, filtered_data)
-        p.success(f"{colors['GREEN']}Data succesfully saved{colors['NC']}")
+        p.success(f"{GREEN}Data succesfully saved{NC}")
     else:
-        p.failure(f"{colors['RED']}Data has not been saved{colors['NC']}")
+        p.failure(f"{RED}Data has not been saved{NC}")
     return filtered_data
 
 
@@ -3068,15 +3427,15 @@ def extractFilterParameters(args, subcommand: str, subsubcommand: str):
     original_length = len(original_data)
     filtered_data = apply_filter_to_data_with_parameters(args, original_data)
     print_before_and_after_filter_length(original_length, len(filtered_data))
-    p = log.progress(f"{colors['PINK']}Saving data{colors['NC']}")
+    p = progressLog(f"{PINK}Saving data{NC}")
     # If the user provided a file, try to obtain the "identifiedAs" parameter based on its path
     object_info_identified = decide_parameters_to_save_data(args, object_info)
     # Save data if needed
     if not args.no_save_output:
         save_data_output(args, subcommand, subsubcommand, object_info_identified, filtered_data)
-        p.success(f"{colors['GREEN']}Data succesfully saved{colors['NC']}")
+        p.success(f"{GREEN}Data succesfully saved{NC}")
     else:
-        p.failure(f"{colors['RED']}Data has not been saved{colors['NC']}")
+        p.failure(f"{RED}Data has not been saved{NC}")
     return filtered_data
 
 
@@ -3105,10 +3464,18 @@ def extractRawData(args, subcommand, search_mode_var: str, enableSave=True, show
         else:
             print(f"{warning} Raw data extracted has not been saved")
     # And we are done
-    print(f"{sb} {colors['GREEN']}Data succesfully obtained from Archives{colors['NC']}")
+    print(data_obtained_from_archives_msg)
     return raw_data, object_info
 
 
+# 'extract raw' sub-subcommands and the search mode they use in 'extractRawData'
+extract_raw_search_modes = {"cone": "cone", "rectangle": "rect", "ring": "ring"}
+# 'extract filter' sub-subcommands and the function that applies them
+extract_filter_functions = {"parameters": extractFilterParameters,
+                            "ellipse": extractEllipseData,
+                            "cordoni": extractCordoniData}
+
+
 def extractCommand(args)->None:
     """
     If the user has selected the command "extract" choose the mode to extract data
@@ -3116,27 +3483,16 @@ def extractCommand(args)->None:
     # 'raw' subcommand
     if args.subcommand == "raw":
         # Check that user has provided a valid format for name
-        checkNameObjectProvidedByUser(args.name)
-        # 'cone' subcommand
-        if args.subsubcommand == "cone":
-            raw_data,_ = extractRawData(args, "raw", "cone")
-            sys.exit(0)
-        if args.subsubcommand == "rectangle":
-            raw_data,_ = extractRawData(args, "raw" ,"rect")
-            sys.exit(0)
-        if args.subsubcommand == "ring":
-            raw_Data,_ = extractRawData(args, "raw", "ring")
+        args.name = checkNameObjectProvidedByUser(args.name)
+        search_mode = extract_raw_search_modes.get(args.subsubcommand)
+        if search_mode is not None:
+            extractRawData(args, "raw", search_mode)
             sys.exit(0)
     # 'filter' subcommand
     if args.subcommand == "filter":
-        if args.subsubcommand == "parameters":
-            filtered_data = extractFilterParameters(args, 'filter', 'parameters')
-            sys.exit(0)
-        if args.subsubcommand == "ellipse":
-            filtered_data = extractEllipseData(args, 'filter', 'ellipse')
-            sys.exit(0)
-        if args.subsubcommand == "cordoni":
-            filtered_data = extractCordoniData(args, 'filter', 'cordoni')
+        filter_function = extract_filter_functions.get(args.subsubcommand)
+        if filter_function is not None:
+            filter_function(args, 'filter', args.subsubcommand)
             sys.exit(0)
 
 
@@ -3152,12 +3508,20 @@ def plotCommand(args) -> None:
     """
     Plot data
     """
+    # Check that user has provided a valid format-name
+    args.name = checkNameObjectProvidedByUser(args.name)
     print("Function still under construction. Come later...")
     if args.subcommand == 'raw':
         pass
     return
 
 
+# Main commands and the function that runs each one of them
+commands_functions = {"show-gaia-content": showGaiaContent,
+                      "extract": extractCommand,
+                      "plot": plotCommand}
+
+
 def main() -> None:
     # Parse the command-line arguments/get flags and their values provided by the user
     parser, args = parseArgs()
@@ -3167,21 +3531,10 @@ def main() -> None:
 
     printBanner()
 
-    # Run 'show-gaia-content' command
-    if args.command == 'show-gaia-content':
-        showGaiaContent(args)
-
-    # Run 'extract' command
-    if args.command == 'extract':
-        # Extract data using Astroquery
-        extractCommand(args)
-
-    if args.command == 'plot':
-        # Check that user has provided a valid format-name
-        checkNameObjectProvidedByUser(args.name)  
-
-        plotCommand(args)
-        
+    # Run the function for the command provided: 'show-gaia-content', 'extract' or 'plot'
+    command_function = commands_functions.get(args.command)
+    if command_function is not None:
+        command_function(args)
 
 if __name__ == "__main__":
     main()
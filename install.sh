@@ -101,19 +101,6 @@ print_multiple_times() {
 }
 
 
-disable_pwntools_update(){
-  # Get Python version
-  version=$(echo -n "$(python3 -V)" | awk '{print $2}')
-
-  major_version=$(echo -n "$version" | awk -F. '{print $1}')
-  minor_version=$(echo -n "$version" | awk -F. '{print $2}')
-
-  
-  file_to_write=$(echo -n "$HOME/.cache/.pwntools-cache-${major_version}.${minor_version}/update")
-
-  echo "never" > $file_to_write || echo "[-] Could not find 'pwntools' cache into '~/.cache' directory to disable automatic updates for this library" 
-}
-
 # MAIN
 main() {
   local ignore_check_python3=false
@@ -169,9 +156,6 @@ main() {
   echo "[+] Disabling '$name' virtual environment..."
   deactivate && echo "[+] Virtual Environment disabled"
 
-  # Disable update for 'pwntools' python library
-  disable_pwntools_update
-
   # Print instructions for future usage
   print_multiple_times 45 "#"
   instructions "$name"